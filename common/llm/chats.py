@@ -1,4 +1,5 @@
 from abc import ABC
+from functools import cache
 from time import sleep
 import langsmith as ls
 from langchain_core.rate_limiters import InMemoryRateLimiter
@@ -21,6 +22,7 @@ class LLMChat(ABC):
         self.llm = None
         self.model_name = None
         self.system_instruction = None
+        self.system_message = None
         self.chat = []
         self.chat_id = None
         self.clear_chat()
@@ -64,6 +66,7 @@ class LLMChat(ABC):
     def set_system_instruction(self, system_instruction: str):
         self.__checkInitilization()
         self.system_instruction = system_instruction
+        self.system_message = create_sys_message(system_instruction)
         self.clear_chat()
 
     def set_chat_id(self, chat_id: str):
@@ -73,6 +76,7 @@ class LLMChat(ABC):
     def clear_system_instruction(self):
         self.__checkInitilization()
         self.system_instruction = None
+        self.system_message = None
         self.clear_chat()    
     
     def get_system_instruction(self):
@@ -80,8 +84,10 @@ class LLMChat(ABC):
         return self.system_instruction
     
     def clear_chat(self):
-        if self.system_instruction is not None:
-            self.chat = [create_sys_message(self.system_instruction)]
+        # every run starts from the same system message, so providers with implicit
+        # prefix caching (Gemini 2.x, OpenAI) can reuse it across runs
+        if self.system_message is not None:
+            self.chat = [self.system_message]
         else:
             self.chat = []
 
@@ -124,3 +130,14 @@ class OpenAIChat(LLMChat):
             max_retries=2,
             api_key=getOpenAIKey(),
         )
+
+@cache
+def getChat(name: str = "gemini") -> LLMChat:
+    """Build the chat backend on first use, so unused clients are never created"""
+    if name == "gemini":
+        return GeminiChat()
+    if name == "ollama":
+        return OllamaChat(model_name="gemma3:4b")
+    if name == "openai":
+        return OpenAIChat(model_name="gpt-4o-mini")
+    raise ValueError(f"Unknown chat backend: {name}")
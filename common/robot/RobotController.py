@@ -1,7 +1,8 @@
 from abc import ABC
 
 class RobotController(ABC):
-    
+    __slots__ = ()
+
     def goFront(self, distance=1.0):
         if not(distance is None) and distance < 0:
             raise ValueError("Distance must be positive")
@@ -2,6 +2,7 @@ import asyncio
 import logging
 from common.robot.RobotController import RobotController
 from common.robot.llm.RobotAction import RobotAction
+from controllers.webots.adapters.lidar import LidarSnapshot
 import threading
 import numpy as np
 from dataclasses import dataclass
@@ -48,7 +49,7 @@ class ActionAdapter:
             print("ActionAdapter: Unknown command", command)
             return ActionResult(status=ActionStatus.FAILURE, message="Unknown command")
         
-    def checkSafety(self, action: RobotAction, lidar: list[float] = []) -> bool:
+    def checkSafety(self, action: RobotAction, lidar: LidarSnapshot = None) -> bool:
         command = action.command
         parameter = action.parameter
         if command == "FRONT" and np.min(lidar) < parameter:
@@ -3,7 +3,7 @@ from common.utils.llm import create_message
 from common.utils.misc import extractJSON
 from common.robot.llm.RobotAction import Motivation, RobotAction
 import logging
-import json
+import orjson
 from jsonschema import validate
 from dataclasses import dataclass
 from typing import Generic, Optional, TypeVar
@@ -77,7 +77,7 @@ class LLMAdapter:
         # Attempt to extract JSON string from the model response
         try:
             extracted = extractJSON(response)
-            action_obj = json.loads(extracted)
+            action_obj = orjson.loads(extracted)
         except Exception as e:
             logger.debug("Failed to extract/parse JSON from response", exc_info=True)
             return Result.failure(InvalidJSON(response))
@@ -2,7 +2,6 @@ import numpy as np
 from typing import List
 from controller import Supervisor
 import random
-import math
 
 OBSTACLES = ["CLOSED_CABINET", "OPEN_CABINET", "TABLE", 
              "PLASTIC_CRATE", "PALLET_STACK", "SINGLE_PALLET_STACK",
@@ -49,17 +48,19 @@ def find_safe_position(supervisor: Supervisor, max_attempts=100):
         y = random.uniform(min[1], max[1])
         return [x, y]
 
-    def is_collision(pos, obstacles, min_dist=0.5):
-        for obj in obstacles:
-            obj_pos = supervisor.getFromDef(obj).getField("translation").getSFVec3f()
-            dx, dy = pos[0]-obj_pos[0], pos[1]-obj_pos[1]
-            if math.hypot(dx, dy) < min_dist:
-                return True
-        return False
+    # obstacles do not move while sampling: read their positions from Webots once, not once per attempt
+    obstacle_positions = np.array([
+        supervisor.getFromDef(obj).getField("translation").getSFVec3f()[:2] for obj in OBSTACLES
+    ])
+
+    def is_collision(pos, min_dist=0.5):
+        dx = obstacle_positions[:, 0] - pos[0]
+        dy = obstacle_positions[:, 1] - pos[1]
+        return bool(np.any(dx * dx + dy * dy < min_dist * min_dist))
     
     for _ in range(max_attempts):
         pos = random_position(getEnvironmentBounds())
-        if not(is_collision(pos, OBSTACLES)):
+        if not(is_collision(pos)):
             return pos
     print("No safe position found")
     return None
@@ -2,35 +2,96 @@ import numpy as np
 import cv2
 import os
 import base64
+import hashlib
+from collections import OrderedDict
+from functools import cache
 from typing import List
-from ultralytics import YOLO
 from common.types.ObjectDetection import ObjectDetection
 
-model = YOLO("yolov8n.pt")
+@cache
+def getDetectionModel():
+    """Load the YOLO model on first use; YOLO_MODEL may point to an exported .engine/.onnx file"""
+    from ultralytics import YOLO
+    return YOLO(os.getenv("YOLO_MODEL", "yolov8n.pt"))
+
+class _FrameCache:
+    """Reuses the last detection results while frames stay nearly identical (mean abs difference of 64x64 thumbnails)"""
+    THUMBNAIL_SIZE = (64, 64)
+    THRESHOLD = 2.0
+    MAX_AGE = 30
+
+    def __init__(self):
+        self.thumbnail = None
+        self.value = None
+        self.age = 0
+
+    def get(self, image):
+        thumbnail = cv2.resize(image, self.THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA).astype(np.int16)
+        if self.thumbnail is not None and self.age < self.MAX_AGE \
+                and np.mean(np.abs(thumbnail - self.thumbnail)) < self.THRESHOLD:
+            self.age += 1
+            return thumbnail, self.value
+        return thumbnail, None
+
+    def put(self, thumbnail, value):
+        self.thumbnail = thumbnail
+        self.value = value
+        self.age = 0
+
+_resultsCache = _FrameCache()
+
+# JPEG/base64 encodings of recent frames, keyed by content hash (LRU)
+_ENCODED_IMAGES_MAX = 16
+_encodedImages = OrderedDict()
+
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 85]
+
+# VLMs resize inputs to roughly this grid anyway; larger frames only cost upload size and tokens
+VLM_MAX_SIDE = 768
+
+def resizeForVLM(image, maxSide: int = VLM_MAX_SIDE):
+    h, w = image.shape[:2]
+    scale = maxSide / max(h, w)
+    if scale >= 1:
+        return image
+    return cv2.resize(image, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
 
 def toBase64Image(image):
-    _, buffer = cv2.imencode('.jpg', image)
-    return base64.b64encode(buffer.tobytes()).decode("utf-8")
+    image = np.ascontiguousarray(image)
+    key = (image.shape, image.dtype.str, hashlib.blake2b(image, digest_size=16).digest())
+    encoded = _encodedImages.get(key)
+    if encoded is not None:
+        _encodedImages.move_to_end(key)
+        return encoded
+    _, buffer = cv2.imencode('.jpg', resizeForVLM(image), _JPEG_PARAMS)
+    encoded = base64.b64encode(buffer).decode("ascii")
+    _encodedImages[key] = encoded
+    if len(_encodedImages) > _ENCODED_IMAGES_MAX:
+        _encodedImages.popitem(last=False)
+    return encoded
 
 def saveImage(image, filename, path='./'):
     if not os.path.exists(path):
         os.makedirs(path)
     cv2.imwrite(f"{path}/{filename}", image)
 
+def _detect(image):
+    """YOLO results for image, reused from the previous frame when the two are nearly identical"""
+    thumbnail, results = _resultsCache.get(image)
+    if results is None:
+        results = getDetectionModel()(image, verbose=False)
+        _resultsCache.put(thumbnail, results)
+    return results
+
 def detectObjects(image):
-    results = model(image, verbose=False)
+    results = _detect(image)
     detections: List[ObjectDetection] = []
+    names = getDetectionModel().names
     for result in results:
-        for box in result.boxes:
-            x, y, w, h = box.xywh[0]
-            detections.append(ObjectDetection(
-                model.names[int(box.cls.item())], 
-                box.conf.item(), 
-                x.item(), 
-                y.item(), 
-                w.item(), 
-                h.item())
-            )        
+        boxes = result.boxes
+        # one tensor -> list conversion per column instead of per-box .item() calls
+        for (x, y, w, h), conf, cls in zip(boxes.xywh.tolist(), boxes.conf.tolist(), boxes.cls.tolist()):
+            detections.append(ObjectDetection(names[int(cls)], conf, x, y, w, h))
     return detections
 
 def box_label(image, box, label, color, text_color):
@@ -41,7 +102,8 @@ def box_label(image, box, label, color, text_color):
     return result
 
 def plotDetections(image):
-    results = model(image, verbose=False)
+    results = _detect(image)
     if len(results) == 0:
         return image
-    return results[0].plot()
+    # always draw on the current frame, only the detections may come from an earlier one
+    return results[0].plot(img=image)
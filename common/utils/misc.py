@@ -1,13 +1,11 @@
-import json
 import re
 
+# This pattern looks for ```json, captures everything until the closing ```
+_JSON_BLOCK = re.compile(r'```json\n(.*?)```', re.DOTALL)
+
 def extractJSON(text: str):
-    # This pattern looks for ```json, captures everything until the closing ```
-    pattern = re.compile(r'```json\n(.*?)```', re.DOTALL)
-    match = pattern.search(text)
+    """Return the body of the first ```json fenced block, or the whole text if there is none"""
+    match = _JSON_BLOCK.search(text)
     if match:
         return match.group(1)
-    else:
-        json.loads(text)
-        return text
-    return None
+    return text
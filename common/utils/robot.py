@@ -1,18 +1,27 @@
+from functools import cache
 from typing import Dict, List, Optional, Any
 import json
+import os
 import numpy as np
 from numpy.typing import NDArray
 
 # File I/O operations
+@cache
 def readSystemInstruction() -> str:
-    """Read system instructions from file."""
+    """Read system instructions from file (read once per process)."""
     with open('system_instruction.txt', 'r') as file:
         return file.read()
 
+_userPromptCache = {'mtime': None, 'data': None}
+
 def readUserPrompt() -> str:
-    """Read user prompt from file."""
-    with open('user_prompt.txt', 'r') as file:
-        return file.read()
+    """Read user prompt from file (re-read only when the file has been modified)."""
+    mtime = os.stat('user_prompt.txt').st_mtime_ns
+    if mtime != _userPromptCache['mtime']:
+        with open('user_prompt.txt', 'r') as file:
+            _userPromptCache['data'] = file.read()
+        _userPromptCache['mtime'] = mtime
+    return _userPromptCache['data']
 
 def save_robot_pose(robot: Any) -> None:
     """Save robot pose to JSON file."""
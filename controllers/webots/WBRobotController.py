@@ -5,6 +5,8 @@ from controllers.webots.adapters.camera import WBCamera
 # self.supervisor.getSelf().getField("translation").getSFVec3f()
 # self.supervisor.getSelf().getField("rotation").getSFRotation()
 class WBRobotController(RobotController):
+    __slots__ = ('camera',)
+
     def __init__(self):
         self.camera: WBCamera = None
 
@@ -1,5 +1,4 @@
 from controller.lidar import Lidar
-from typing import List
 import numpy as np
 from dataclasses import dataclass
 from controllers.webots.adapters.motor import WBMotor
@@ -20,10 +19,17 @@ class LidarConfig:
         return self.horizontal_resolution / self.fov_degrees
 
 class LidarSnapshot:
-    """Represents a snapshot of lidar distance measurements"""
-    def __init__(self, distances: List[float]):
+    """Represents a snapshot of lidar distance measurements
+
+    distances is a read-only view into the lidar's range image, only valid until the
+    next simulation step; copy it (np.array(snapshot)) to keep or modify the values.
+    """
+    def __init__(self, distances: np.ndarray):
         self.distances = distances
 
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array(self.distances, dtype=dtype, copy=copy)
+
     def __len__(self) -> int:
         return len(self.distances)
 
@@ -41,7 +47,8 @@ class LidarSnapshot:
 
 class WBLidar:
     """Webots Lidar adapter with simplified point cloud handling"""
-    def __init__(self, lidar: 'Lidar', time_step: int):
+    def __init__(self, lidar: 'Lidar', time_step: int, clock: Callable[[], float] = None):
+        """clock returns the current simulation time (e.g. Supervisor.getTime); without it every read hits the device"""
         self.lidar = lidar
         self.lidar.enable(time_step)
         self.lidar.enablePointCloud()
@@ -49,6 +56,10 @@ class WBLidar:
             horizontal_resolution=self.lidar.getHorizontalResolution(),
             fov_radians=self.lidar.getFov()
         )
+        self._clock = clock
+        self._image: np.ndarray = None
+        self._imageTime: float = None
+        self._slices = {}
 
     def getPoints(self, fov_degrees: int, rotation_degrees: int = 0) -> LidarSnapshot:
         """Get lidar points within specified FOV and rotation
@@ -60,12 +71,11 @@ class WBLidar:
         Returns:
             LidarSnapshot containing the requested points
         """
-        self._validate_params(fov_degrees, rotation_degrees)
-        
-        if fov_degrees == 0:
-            return self._get_single_point(rotation_degrees)
-        
-        return self._get_point_range(fov_degrees, rotation_degrees)
+        roi = self._slices.get((fov_degrees, rotation_degrees))
+        if roi is None:
+            self._validate_params(fov_degrees, rotation_degrees)
+            roi = self._slices[(fov_degrees, rotation_degrees)] = self._get_slice(fov_degrees, rotation_degrees)
+        return LidarSnapshot(self.getImage()[roi])
 
     def _validate_params(self, fov_degrees: int, rotation_degrees: int) -> None:
         """Validate FOV and rotation parameters"""
@@ -76,29 +86,33 @@ class WBLidar:
         if not -max_rotation <= rotation_degrees <= max_rotation:
             raise ValueError(f"Invalid rotation for given FOV")
 
-    def _get_single_point(self, rotation_degrees: int) -> LidarSnapshot:
-        """Get single point measurement at specified rotation"""
+    def _get_slice(self, fov_degrees: int, rotation_degrees: int) -> slice:
+        """Get the range image slice covering the specified FOV and rotation"""
         midpoint = self._get_midpoint(rotation_degrees)
-        return LidarSnapshot([self.getImage()[midpoint]])
+        if fov_degrees == 0:
+            return slice(midpoint, midpoint + 1)
 
-    def _get_point_range(self, fov_degrees: int, rotation_degrees: int) -> LidarSnapshot:
-        """Get range of points for specified FOV and rotation"""
-        midpoint = self._get_midpoint(rotation_degrees)
         offset = int(self.config.points_per_degree * (fov_degrees / 2))
         
         start = max(midpoint - offset, 0)
         end = min(midpoint + offset, self.config.horizontal_resolution - 1)
         
-        return LidarSnapshot(self.getImage()[int(start):int(end)])
+        return slice(int(start), int(end))
 
     def _get_midpoint(self, rotation_degrees: int) -> int:
         """Calculate midpoint index for given rotation"""
         rotation_offset = int(self.config.points_per_degree * rotation_degrees)
         return (self.config.horizontal_resolution // 2) + rotation_offset
 
-    def getImage(self) -> List[float]:
-        """Get reversed range image from lidar"""
-        return list(reversed(self.lidar.getRangeImage()))
+    def getImage(self) -> np.ndarray:
+        """Get reversed range image from lidar, fetched at most once per simulation time"""
+        now = self._clock() if self._clock is not None else None
+        image = self._image
+        if image is None or now is None or now != self._imageTime:
+            image = np.frombuffer(self.lidar.getRangeImage(data_type='buffer'), dtype=np.float32)[::-1]
+            self._image = image
+            self._imageTime = now
+        return image
     
     def setEnablePointCloud(self, enabled: bool):
         """Enable or disable point cloud"""
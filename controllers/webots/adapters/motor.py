@@ -7,8 +7,11 @@ from typing import Callable
 
 MAX_ACTION_STEP_DURATION = 315
 TOLERANCE = 0.05
+_ROTATIONAL = constant("ROTATIONAL")
 
 class WBMotor():
+    __slots__ = ('motor', 'executor', 'eventManager', 'sensor', 'minPosition', 'maxPosition', 'maxVelocity', '_type')
+
     def __init__(self, motor: Motor, timeStep: int, eventManager: EventManager):
         self.motor: Motor = motor
         self.executor = ThreadPoolExecutor(max_workers=2)
@@ -18,6 +21,7 @@ class WBMotor():
         self.minPosition = self.motor.min_position
         self.maxPosition = self.motor.max_position
         self.maxVelocity = self.motor.max_velocity
+        self._type = self.motor.getType()
         self.sensor.enable(timeStep)
         self.motor.setPosition(float('inf'))
         self.motor.setVelocity(0)
@@ -39,19 +43,20 @@ class WBMotor():
         position = self.minPosition + (self.maxPosition - self.minPosition) * percent
         self.setPosition(position)
         self.setSpeed(self.maxVelocity)
+        if onComplete is None:
+            return
         def handler(_: EventData):
             if self.__fuzzyEquals(self.getPositionPercent(), percent):
                 self.eventManager.unsubscribe(abort_handler)
                 onComplete()
                 self.eventManager.unsubscribe(handler)
-        if onComplete is not None:
-            self.eventManager.subscribe(EventType.SIMULATION_STEP, handler)
-            def abort_handler(_: EventData):
-                self.eventManager.unsubscribe(handler)
-                self.eventManager.unsubscribe(abort_handler)
-                self.stop()
-                onComplete()
-            self.eventManager.subscribe(EventType.SIMULATION_ABORTED, abort_handler)
+        def abort_handler(_: EventData):
+            self.eventManager.unsubscribe(handler)
+            self.eventManager.unsubscribe(abort_handler)
+            self.stop()
+            onComplete()
+        self.eventManager.subscribe(EventType.SIMULATION_STEP, handler)
+        self.eventManager.subscribe(EventType.SIMULATION_ABORTED, abort_handler)
 
     def __fuzzyEquals(self, a: float, b: float, epsilon: float = 0.01) -> bool:
         return abs(a - b) < epsilon
@@ -59,15 +64,14 @@ class WBMotor():
     def getPosition(self) -> float:
         return self.sensor.getValue()
     
-    def reach(self, targetValue, deltaToCurrentValue):
+    def reach(self, targetValue: float, scale: float):
+        """Resolve the returned future once |Δposition| * scale reaches targetValue"""
         initialValue = self.getPosition()
+        low = (targetValue - TOLERANCE * 2) / scale
+        high = (targetValue + TOLERANCE * 2) / scale
+        getValue = self.sensor.getValue
         def handler():
-            currentValue = self.getPosition()
-            delta = abs(currentValue - initialValue)
-            actualValue = deltaToCurrentValue(delta)
-            while not(abs(actualValue - targetValue) < TOLERANCE * 2):
-                delta = abs(self.getPosition() - initialValue)
-                actualValue = deltaToCurrentValue(delta)
+            while not (low < abs(getValue() - initialValue) < high):
                 pass
             return True
         f = self.executor.submit(handler)
@@ -84,4 +88,4 @@ class WBMotor():
 
     @property
     def isRotational(self) -> bool:
-        return self.motor.getType() == constant("ROTATIONAL")   
+        return self._type == _ROTATIONAL   
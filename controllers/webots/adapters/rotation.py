@@ -1,12 +1,15 @@
+import math
 import numpy as np
 
 DOUBLE_EQUALITY_TOLERANCE = 1e-10  # This mimics WbPrecision::DOUBLE_EQUALITY_TOLERANCE
 
 def clamped_acos(value):
-    return np.arccos(np.clip(value, -1.0, 1.0))
+    return math.acos(-1.0 if value < -1.0 else 1.0 if value > 1.0 else value)
 
 class WbRotation:
     # This was originally a C++ class in Webots, adapted to Python.
+    __slots__ = ('mX', 'mY', 'mZ', 'mAngle')
+
     def __init__(self):
         self.mX = 0.0
         self.mY = 0.0
@@ -21,28 +24,29 @@ class WbRotation:
             self.mZ /= norm
 
     def from_matrix3(self, M):
-        theta = clamped_acos((M[0, 0] + M[1, 1] + M[2, 2] - 1) / 2)
+        m00, m01, m02, m10, m11, m12, m20, m21, m22 = np.asarray(M).ravel().tolist()
+        theta = clamped_acos((m00 + m11 + m22 - 1) / 2)
 
         if theta < DOUBLE_EQUALITY_TOLERANCE:
             self.mX, self.mY, self.mZ, self.mAngle = 1.0, 0.0, 0.0, 0.0
             return
-        elif np.pi - theta < DOUBLE_EQUALITY_TOLERANCE:
-            if M[0, 0] > M[1, 1] and M[0, 0] > M[2, 2]:
-                self.mX = np.sqrt(M[0, 0] - M[1, 1] - M[2, 2] + 1) / 2
-                self.mY = M[0, 1] / (2 * self.mX)
-                self.mZ = M[0, 2] / (2 * self.mX)
-            elif M[1, 1] > M[0, 0] and M[1, 1] > M[2, 2]:
-                self.mY = np.sqrt(M[1, 1] - M[0, 0] - M[2, 2] + 1) / 2
-                self.mX = M[0, 1] / (2 * self.mY)
-                self.mZ = M[1, 2] / (2 * self.mY)
+        elif math.pi - theta < DOUBLE_EQUALITY_TOLERANCE:
+            if m00 > m11 and m00 > m22:
+                self.mX = math.sqrt(m00 - m11 - m22 + 1) / 2
+                self.mY = m01 / (2 * self.mX)
+                self.mZ = m02 / (2 * self.mX)
+            elif m11 > m00 and m11 > m22:
+                self.mY = math.sqrt(m11 - m00 - m22 + 1) / 2
+                self.mX = m01 / (2 * self.mY)
+                self.mZ = m12 / (2 * self.mY)
             else:
-                self.mZ = np.sqrt(M[2, 2] - M[0, 0] - M[1, 1] + 1) / 2
-                self.mX = M[0, 2] / (2 * self.mZ)
-                self.mY = M[1, 2] / (2 * self.mZ)
+                self.mZ = math.sqrt(m22 - m00 - m11 + 1) / 2
+                self.mX = m02 / (2 * self.mZ)
+                self.mY = m12 / (2 * self.mZ)
         else:
-            self.mX = M[2, 1] - M[1, 2]
-            self.mY = M[0, 2] - M[2, 0]
-            self.mZ = M[1, 0] - M[0, 1]
+            self.mX = m21 - m12
+            self.mY = m02 - m20
+            self.mZ = m10 - m01
 
         self.mAngle = theta
         self.normalize_axis()
@@ -1,13 +1,20 @@
 from concurrent.futures import ThreadPoolExecutor
 
+# Webots key codes (ASCII and the arrow/special keys) are all below this value
+MAX_KEY_CODE = 1024
+
 class KeyboardController:
+    __slots__ = ('controls', 'NO_KEY_HANDLER', 'executor')
+
     def __init__(self):
-        self.controls = {}
+        self.controls = [None] * MAX_KEY_CODE
         self.NO_KEY_HANDLER = None
         self.executor = ThreadPoolExecutor(max_workers=4)
         pass
 
     def onKey(self, key, handler):
+        if not 0 <= key < MAX_KEY_CODE:
+            raise ValueError(f"Key code must be between 0 and {MAX_KEY_CODE - 1}, got {key}")
         self.controls[key] = handler
         return self
 
@@ -16,9 +23,9 @@ class KeyboardController:
         return self    
 
     def execute(self, key):
-        if key in self.controls:
+        if 0 <= key < MAX_KEY_CODE and (handler := self.controls[key]) is not None:
             try:
-                f = self.executor.submit(self.controls[key])
+                f = self.executor.submit(handler)
                 return f
             except Exception as e:
                 print(f"KeyboardController: Error executing handler for key {key}: {str(e)}")
@@ -26,4 +33,4 @@ class KeyboardController:
         elif key == -1 and self.NO_KEY_HANDLER != None:
             self.NO_KEY_HANDLER()
         return False
-        
\ No newline at end of file
+
@@ -10,6 +10,8 @@ def unlockAndHandle(unlocker, handler):
         handler()
 
 class KhepheraController(WBRobotController):
+    __slots__ = ('eventManager', 'wheelSystem', 'locked')
+
     def __init__(self, devices: KhepheraDevices, eventManager: EventManager=None):
         super().__init__()
         self.camera = devices.CAMERA
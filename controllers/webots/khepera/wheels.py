@@ -3,6 +3,8 @@ from controllers.webots.adapters.motor import WBMotor
 
 
 class KhepheraWheel:
+    __slots__ = ('motor',)
+
     WHEEL_RADIUS = 0.021
     CENTER_TO_WHEEL = 0.0527
     MAX_SPEED = 47.6 / 3
@@ -18,8 +20,8 @@ class KhepheraWheel:
     def getPosition(self):
         return self.motor.getPosition()
 
-    def reach(self, targetValue, deltaToCurrentValue, completionHandler=None):
-        self.motor.reach(targetValue, deltaToCurrentValue, completionHandler)
+    def reach(self, targetValue, scale, completionHandler=None):
+        self.motor.reach(targetValue, scale, completionHandler)
 
 class KhepheraWheelSystem:
     def __init__(self, left_motor: WBMotor, right_motor: WBMotor):
@@ -32,7 +34,7 @@ class KhepheraWheelSystem:
         if distance != None:
             self.left_wheel.reach(
                 targetValue=distance,
-                deltaToCurrentValue=lambda delta: delta * KhepheraWheel.WHEEL_RADIUS,
+                scale=KhepheraWheel.WHEEL_RADIUS,
                 completionHandler=completionHandler
             )
         elif completionHandler is not None:
@@ -44,7 +46,7 @@ class KhepheraWheelSystem:
         if angle != None:
             self.left_wheel.reach(
                 targetValue=np.deg2rad(angle),
-                deltaToCurrentValue=lambda delta: abs(delta * KhepheraWheel.WHEEL_RADIUS / KhepheraWheel.CENTER_TO_WHEEL),
+                scale=KhepheraWheel.WHEEL_RADIUS / KhepheraWheel.CENTER_TO_WHEEL,
                 completionHandler= lambda: (completionHandler() if completionHandler is not None else None, self.stop())
             )
         elif completionHandler is not None:
@@ -54,5 +56,5 @@ class KhepheraWheelSystem:
         self.left_wheel.setSpeed(0)
         self.right_wheel.setSpeed(0)        
 
-    def reach(self, targetValue, deltaToCurrentValue, completionHandler=None):
-        self.left_wheel.reach(targetValue, deltaToCurrentValue, completionHandler)
+    def reach(self, targetValue, scale, completionHandler=None):
+        self.left_wheel.reach(targetValue, scale, completionHandler)
@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from controllers.webots.pr2.wheels import PR2WheelSystem
 from controllers.webots.WBRobotController import WBRobotController
 from simulation.observers import EventManager, EventType, EventData
@@ -22,10 +23,6 @@ class PR2Controller(WBRobotController):
         self.__initializeArms()
         self.eventManager = eventManager
         self.devices.TILT_LIDAR.setPointCloudEnabled(False)
-        eventManager.subscribe(EventType.SIMULATION_STEP, self.__onSimulationStep)    
-    
-    def __onSimulationStep(self, _: EventData):
-        self.devices.HEAD_PAN_JOINT.setPositionByPercentage(0.5)
 
     def __initializeArms(self):
         self.devices.LEFT_SHOULDER_LIFT.setToMaxPosition()
@@ -34,37 +31,40 @@ class PR2Controller(WBRobotController):
         self.devices.LEFT_ELBOW_FLEX.setToMinPosition()
         self.devices.RIGHT_ELBOW_FLEX.setToMinPosition()
 
+        # motor commands are latched by Webots, no need to repeat them every step
+        self.devices.HEAD_PAN_JOINT.setPositionByPercentage(0.5)
+
     def goFront(self, distance=1.0):
         super().goFront(distance)
         res = self.wheelSystem.moveForward(1.0, distance)
         if res is not None:
             res.result()
-            self.stop()
+            self.stop(res)
        
     def goBack(self, distance=1.0):
         super().goBack(distance)
         res = self.wheelSystem.moveForward(-1.0, distance)
         if res is not None:
             res.result()
-            self.stop()
+            self.stop(res)
 
     def rotateLeft(self, angle=1.0):
         super().rotateLeft(angle)
         res = self.wheelSystem.rotate(speed=-1.0, angle=angle)
         if angle is not None:
             res.result()
-            self.stop()
+            self.stop(res)
 
     def rotateRight(self, angle=1.0):
         super().rotateRight(angle)
         res = self.wheelSystem.rotate(speed=1.0, angle=angle)
         if angle is not None:
             res.result()
-            self.stop()
+            self.stop(res)
 
-    def stop(self):
+    def stop(self, reach: Future = None):
         super().stop()
-        self.wheelSystem.stop()
+        self.wheelSystem.stop(reach)
 
     def getDepthImage(self):
         samples = np.linspace(0.0, 1.0, 300)
@@ -1,36 +1,49 @@
-from concurrent.futures import ThreadPoolExecutor
-from controllers.webots.adapters.motor import WBMotor
+from concurrent.futures import Future
+from threading import Lock
+from controllers.webots.adapters.motor import WBMotor, TOLERANCE
 from enum import Enum
-import numpy as np
+import math
 from controllers.webots.pr2.devices import PR2Devices
-from simulation.observers import EventManager
+from simulation.observers import EventManager, EventData, EventType
+
+_ROT_ANGLES = (math.pi/4, -math.pi/4, -math.pi/4, math.pi/4)
+_DEG2RAD = math.pi / 180
 
 class PR2Wheel():
+    __slots__ = ('l', 'r')
+
     WHEEL_RADIUS = 0.08
     CENTER_TO_WHEEL = 0.318
     MAX_SPEED = 6
     MAX_ACTION_STEP_DURATION = 315
 
     def __init__(self, l_wheel: WBMotor, r_wheel: WBMotor):
-        self.wheels = {
-            "L": l_wheel,
-            "R": r_wheel
+        self.l = l_wheel
+        self.r = r_wheel
+
+    @property
+    def wheels(self):
+        return {
+            "L": self.l,
+            "R": self.r
         }
 
     def setSpeed(self, velocity: float):
-        for _, w in self.wheels.items():
-            w.setSpeed(velocity)
+        self.l.setSpeed(velocity)
+        self.r.setSpeed(velocity)
     
     def getPosition(self):
-        return self.wheels["L"].getPosition()
+        return self.l.getPosition()
     
-    def reach(self, targetValue, deltaToCurrentValue):
-        return self.wheels["L"].reach(
+    def reach(self, targetValue, scale):
+        return self.l.reach(
             targetValue=targetValue, 
-            deltaToCurrentValue=deltaToCurrentValue
+            scale=scale
         )
 
 class PR2CasterWheel():
+    __slots__ = ('wheel', 'caster')
+
     def __init__(self, wheel: PR2Wheel, caster: WBMotor):
         self.wheel = wheel
         self.caster = caster
@@ -46,10 +59,10 @@ class PR2CasterWheel():
     def setRotation(self, angle: float):
         return self.caster.setPosition(angle)
     
-    def reach(self, targetValue, deltaToCurrentValue):
+    def reach(self, targetValue, scale):
         return self.wheel.reach(
             targetValue=targetValue, 
-            deltaToCurrentValue=deltaToCurrentValue,
+            scale=scale,
         )
     
 class WheelPosition(Enum):
@@ -58,53 +71,118 @@ class WheelPosition(Enum):
     BACK_LEFT = "bl"
     BACK_RIGHT = "br" 
 
+# Index of each wheel position in PR2WheelSystem._wheelOrder
+_WHEEL_POSITIONS = (WheelPosition.BACK_LEFT, WheelPosition.BACK_RIGHT, WheelPosition.FRONT_LEFT, WheelPosition.FRONT_RIGHT)
+
+class _Reach:
+    """Pending wheel motion, checked against the back-left wheel on every simulation step"""
+    __slots__ = ('initial', 'low', 'high', 'future')
+
+    def __init__(self, initial: float, target: float, scale: float, future: Future):
+        # |Δ| * scale within TOLERANCE * 2 of target, solved for |Δ| once instead of every step
+        self.initial = initial
+        self.low = (target - TOLERANCE * 2) / scale
+        self.high = (target + TOLERANCE * 2) / scale
+        self.future = future
+
+    def reached(self, position: float) -> bool:
+        return self.low < abs(position - self.initial) < self.high
+
 class PR2WheelSystem:
+    __slots__ = ('eventManager', '_bl', '_br', '_fl', '_fr', '_wheelOrder', '_lMotors', '_rMotors', '_casters',
+                 '_blPosition', '_reach', '_lastReach', '_reachLock')
+
     def __init__(self, devices: PR2Devices, eventManager: EventManager):
         self.eventManager = eventManager
-        self.executor = ThreadPoolExecutor(max_workers=4)
-        self.wheels = {
-            WheelPosition.BACK_LEFT: PR2CasterWheel(
-                PR2Wheel(devices.BACK_LEFT_LEFT_WHEEL, devices.BACK_LEFT_RIGHT_WHEEL), devices.BACK_LEFT_CASTER
-            ),
-            WheelPosition.BACK_RIGHT: PR2CasterWheel(
-                PR2Wheel(devices.BACK_RIGHT_LEFT_WHEEL, devices.BACK_RIGHT_RIGHT_WHEEL), devices.BACK_RIGHT_CASTER
-            ),
-            WheelPosition.FRONT_LEFT: PR2CasterWheel(
-                PR2Wheel(devices.FRONT_LEFT_LEFT_WHEEL, devices.FRONT_LEFT_RIGHT_WHEEL), devices.FRONT_LEFT_CASTER
-            ),
-            WheelPosition.FRONT_RIGHT: PR2CasterWheel(
-                PR2Wheel(devices.FRONT_RIGHT_LEFT_WHEEL, devices.FRONT_RIGHT_RIGHT_WHEEL), devices.FRONT_RIGHT_CASTER
-            )
-        }
+        self._bl = PR2CasterWheel(
+            PR2Wheel(devices.BACK_LEFT_LEFT_WHEEL, devices.BACK_LEFT_RIGHT_WHEEL), devices.BACK_LEFT_CASTER
+        )
+        self._br = PR2CasterWheel(
+            PR2Wheel(devices.BACK_RIGHT_LEFT_WHEEL, devices.BACK_RIGHT_RIGHT_WHEEL), devices.BACK_RIGHT_CASTER
+        )
+        self._fl = PR2CasterWheel(
+            PR2Wheel(devices.FRONT_LEFT_LEFT_WHEEL, devices.FRONT_LEFT_RIGHT_WHEEL), devices.FRONT_LEFT_CASTER
+        )
+        self._fr = PR2CasterWheel(
+            PR2Wheel(devices.FRONT_RIGHT_LEFT_WHEEL, devices.FRONT_RIGHT_RIGHT_WHEEL), devices.FRONT_RIGHT_CASTER
+        )
+        # bl, br, fl, fr: same order as _WHEEL_POSITIONS and the __setWheelSpeeds/__setWheelAngles arguments
+        self._wheelOrder = (self._bl, self._br, self._fl, self._fr)
+        # flat per-actuator views so speed/angle commands skip the wrapper layers
+        self._lMotors = tuple(wheel.wheel.l for wheel in self._wheelOrder)
+        self._rMotors = tuple(wheel.wheel.r for wheel in self._wheelOrder)
+        self._casters = tuple(wheel.caster for wheel in self._wheelOrder)
+        self._blPosition = devices.BACK_LEFT_LEFT_WHEEL.sensor.getValue
+        self._reach: _Reach = None
+        # future of the most recently started reach, kept after it resolves
+        self._lastReach: Future = None
+        self._reachLock = Lock()
+        eventManager.subscribe(EventType.SIMULATION_STEP, self.__onSimulationStep)
+
+    @property
+    def wheels(self):
+        return dict(zip(_WHEEL_POSITIONS, self._wheelOrder))
 
     def moveForward(self, speed: float = 1.0, distance: float = None):
         self.__setWheelSpeeds(speed, speed, speed, speed)
         if distance != None:
-            return self.wheels[WheelPosition.BACK_LEFT].reach(distance,lambda delta: delta * PR2Wheel.WHEEL_RADIUS)
+            return self.__reach(distance, PR2Wheel.WHEEL_RADIUS)
         return None
 
     def rotate(self, speed: float = 1.0, angle: float = None, completionHandler=None):
-        self.__setWheelAngles(np.pi/4, -np.pi/4, -np.pi/4, np.pi/4)
+        self.__setWheelAngles(*_ROT_ANGLES)
         self.__setWheelSpeeds(speed, -speed, speed, -speed)
         if angle != None:
-            return self.wheels[WheelPosition.BACK_LEFT].reach(
-                targetValue=np.deg2rad(angle),
-                deltaToCurrentValue=lambda delta: abs(delta * PR2Wheel.WHEEL_RADIUS / PR2Wheel.CENTER_TO_WHEEL),
-            )
+            return self.__reach(angle * _DEG2RAD, PR2Wheel.WHEEL_RADIUS / PR2Wheel.CENTER_TO_WHEEL)
         return None
 
-    def stop(self):
+    def stop(self, reach: Future = None):
+        """Stop the wheels; with reach, only if no newer reach has started since, so a superseded waiter leaves the new motion alone"""
+        if not self.__cancelReach(reach):
+            return
         self.__setWheelSpeeds(0, 0, 0, 0)
         self.__setWheelAngles(0, 0, 0, 0)    
 
+    def __reach(self, targetValue: float, scale: float) -> Future:
+        """Resolve the returned future once |Δposition| * scale of the back-left wheel reaches targetValue"""
+        future = Future()
+        with self._reachLock:
+            previous = self._reach
+            self._reach = _Reach(self._blPosition(), targetValue, scale, future)
+            self._lastReach = future
+        # resolved only after the new reach is installed: its waiter may call stop() right away
+        if previous is not None:
+            previous.future.set_result(False)
+        return future
+
+    def __cancelReach(self, owner: Future = None) -> bool:
+        with self._reachLock:
+            if owner is not None and owner is not self._lastReach:
+                return False
+            previous = self._reach
+            self._reach = None
+        if previous is not None:
+            previous.future.set_result(False)
+        return True
+
+    def __onSimulationStep(self, _: EventData):
+        reach = self._reach
+        if reach is None:
+            return
+        if reach.reached(self._blPosition()):
+            with self._reachLock:
+                if self._reach is not reach:
+                    return
+                self._reach = None
+            reach.future.set_result(True)
+
     def __setWheelSpeeds(self, bl: float = 0.0, br: float = 0.0, fl: float = 0.0, fr: float = 0.0):
-        self.wheels[WheelPosition.BACK_LEFT].setSpeed(bl * PR2Wheel.MAX_SPEED)
-        self.wheels[WheelPosition.BACK_RIGHT].setSpeed(br * PR2Wheel.MAX_SPEED)
-        self.wheels[WheelPosition.FRONT_LEFT].setSpeed(fl * PR2Wheel.MAX_SPEED)
-        self.wheels[WheelPosition.FRONT_RIGHT].setSpeed(fr * PR2Wheel.MAX_SPEED)
+        maxSpeed = PR2Wheel.MAX_SPEED
+        for l, r, speed in zip(self._lMotors, self._rMotors, (bl, br, fl, fr)):
+            speed *= maxSpeed
+            l.setSpeed(speed)
+            r.setSpeed(speed)
 
     def __setWheelAngles(self, bl: float = 0.0, br: float = 0.0, fl: float = 0.0, fr: float = 0.0):
-        self.wheels[WheelPosition.BACK_LEFT].setRotation(bl)
-        self.wheels[WheelPosition.BACK_RIGHT].setRotation(br)
-        self.wheels[WheelPosition.FRONT_LEFT].setRotation(fl)
-        self.wheels[WheelPosition.FRONT_RIGHT].setRotation(fr)         
+        for caster, angle in zip(self._casters, (bl, br, fl, fr)):
+            caster.setPosition(angle)
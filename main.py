@@ -1,6 +1,6 @@
-from concurrent.futures import Future, ThreadPoolExecutor
-import threading
-from common.llm.chats import GeminiChat, OllamaChat, OpenAIChat
+from concurrent.futures import Future
+from common.llm.chats import getChat
+import os
 from common.robot.LLMRobotController import LLMRobotController
 from common.utils.environment import getRobotPose, readRobotPose, setRobotPose, setRandomRobotPose
 from common.utils.geometry import find_safe_position
@@ -10,24 +10,41 @@ from controllers.webots.keyboard import KeyboardController
 from controller import Keyboard, Supervisor
 from common.utils.robot import readSystemInstruction, readUserPrompt
 from dotenv import load_dotenv
-from simulation import LLMSession
 from simulation.observers import EventManager
 from simulation.events import EventType, StepEventData
 import cv2
 import json
-import datetime
 from simulation.sim import LLMObserver
 import asyncio
-from threading import Lock
+from threading import Lock, Thread
+from time import monotonic
 
-def handle_keyboard_input(key, robot, initial_pose):
-        if ord('0') <= key <= ord('9'):
-            execute_plan(key - ord('0'), robot, initial_pose)
+_KEY_0 = ord('0')
+_plans = {}
+
+def load_plan(plan_number):
+    plan = _plans.get(plan_number)
+    if plan is None:
+        with open(f'plan_{plan_number}.json', 'r') as file:
+            plan = _plans[plan_number] = json.load(file)
+    return plan
+
+def debounced(handler, interval):
+    """Wrap a key handler so that presses less than interval seconds after the previous one are ignored"""
+    lastPress = [float('-inf')]
+    lock = Lock()
+    def wrapper():
+        with lock:
+            now = monotonic()
+            last, lastPress[0] = lastPress[0], now
+        if now - last < interval:
+            return None
+        return handler()
+    return wrapper
 
 def execute_plan(plan_number, robot, initial_pose):
     try:
-        with open(f'plan_{plan_number}.json', 'r') as file:
-            plan = json.loads(file.read())
+        plan = load_plan(plan_number)
         robot.setPosition(initial_pose["position"])
         robot.setRotation(initial_pose["rotation"])
         robot.executePlan(plan)
@@ -51,7 +68,7 @@ async def simulationBatch():
 
     try:
         with open(prompts_path, "r") as f:
-            prompts = [line.strip() for line in f.readlines() if line.strip() and not line.strip().startswith("#")]
+            prompts = [line for line in map(str.strip, f) if line and not line.startswith("#")]
     except Exception as e:
         print(f"simulationBatch: Error reading prompts file: {e}")
         return
@@ -106,10 +123,11 @@ async def simulationBatch():
 
 if __name__ == "__main__":
     load_dotenv()
-    executor = ThreadPoolExecutor(max_workers=4)
 
     TIME_STEP = 64
     MAX_SPEED = 6.28
+    # Webots repeats a held key every step; ignore repeats of LLM keys within this many seconds
+    LLM_KEY_DEBOUNCE = 0.5
     eventManager = EventManager()
     supervisor = Supervisor()
     llmObserver = LLMObserver(supervisor, eventManager)
@@ -117,18 +135,19 @@ if __name__ == "__main__":
     # khepheraDevices = KhepheraDevices(supervisor, eventManager, TIME_STEP)
     robot = PR2Controller(pr2Devices, eventManager)
     # robot = KhepheraController(khepheraDevices, eventManager)
-    geminiChat = GeminiChat()
-    ollamaChat = OllamaChat(model_name="gemma3:4b")
-    openaiChat = OpenAIChat(model_name="gpt-4o-mini")
-    robotChat = geminiChat
+    robotChat = getChat(os.getenv("ROBOT_CHAT", "gemini"))
     robotChat.set_system_instruction(readSystemInstruction())
     llmController = LLMRobotController(robot, robotChat, eventManager)
 
+    # Long-lived event loop for LLM sessions: key handlers schedule work on it and return immediately
+    llmLoop = asyncio.new_event_loop()
+    Thread(target=llmLoop.run_forever, daemon=True).start()
+    def ask_llm(prompt: str) -> Future:
+        return asyncio.run_coroutine_threadsafe(llmController.ask(prompt), llmLoop)
+
     keyboard = Keyboard()
     keyboard.enable(TIME_STEP)
-    image = None
     initialPose = None
-    robotLock = Lock()
     simulationLock = Lock()
     # Prevent starting more than one simulation batch at a time
     batchLock = Lock()
@@ -147,9 +166,9 @@ if __name__ == "__main__":
     supervisor.step(TIME_STEP)
     pose = getRobotPose(supervisor)
     simulationKeyboardController = KeyboardController()
-    simulationKeyboardController.onKey(ord('P'), lambda: asyncio.run(llmController.ask(readUserPrompt())))
+    simulationKeyboardController.onKey(ord('P'), debounced(lambda: ask_llm(readUserPrompt()), LLM_KEY_DEBOUNCE))
     simulationKeyboardController.onKey(ord('L'), lambda: print("Front Lidar:", robot.getFrontLidarImage()))
-    simulationKeyboardController.onKey(ord('B'), lambda: (setRobotPose(supervisor, readRobotPose()), asyncio.run(llmController.ask(readUserPrompt()))))
+    simulationKeyboardController.onKey(ord('B'), debounced(lambda: (setRobotPose(supervisor, readRobotPose()), ask_llm(readUserPrompt())), LLM_KEY_DEBOUNCE))
     simulationKeyboardController.onKey(ord('H'), lambda: print("Environment bounds:", setRandomRobotPose(supervisor)))
     # Start the full simulation batch sequentially when G is pressed. Uses batchLock to avoid parallel batches.
     def start_simulation_batch():
@@ -159,22 +178,18 @@ if __name__ == "__main__":
             print("start_simulation_batch: Batch already running; ignoring G press")
             return
         print("start_simulation_batch: Acquired batch lock, starting simulation batch...")
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(simulationBatch())
-            return result
-        except Exception as e:
-            print(f"start_simulation_batch: Error during batch: {e}")
-        
-    simulationKeyboardController.onKey(ord('G'), start_simulation_batch)
+        batch = asyncio.run_coroutine_threadsafe(simulationBatch(), llmLoop)
+        batch.add_done_callback(on_simulation_batch_done)
+        return batch
+
+    def on_simulation_batch_done(batch: Future):
+        batchLock.release()
+        if batch.exception() is not None:
+            print(f"start_simulation_batch: Error during batch: {batch.exception()}")
 
-    def save_session(session: LLMSession):
-        # create a YYYY_MM-DD_HH-MM-SS format for the session ID
-        filename = datetime.datetime.now().strftime("%Y_%m_%d-%H_%M_%S")
-        with open(f"experiments/experiment_{filename}.json", "w") as file:
-            json.dump(session.asObject(), file, indent=4)
-        print("Session saved:", session.id)
+    simulationKeyboardController.onKey(ord('G'), debounced(start_simulation_batch, LLM_KEY_DEBOUNCE))
+    for digit in range(10):
+        simulationKeyboardController.onKey(_KEY_0 + digit, lambda digit=digit: execute_plan(digit, robot, initialPose))
 
 
     eventManager.subscribe(EventType.SIMULATION_STARTED, lambda _: (print("LLM started"), simulationLock.acquire(blocking=False)))
@@ -182,39 +197,51 @@ if __name__ == "__main__":
     eventManager.subscribe(EventType.SIMULATION_ABORTED, lambda _: (print("LLM aborted"), simulationLock.release()))
 
     step_counter = 0
+    # reused every step; SIMULATION_STEP handlers must not keep a reference to it
+    stepEvent = StepEventData(step_counter)
     initialPose = pose
+    # Future of the robot motion currently running, if any; new robot keys are ignored until it is done
+    robotTask = None
+    robotStopped = False
     while supervisor.step(TIME_STEP) != -1:
         try:
-            eventManager.notify(EventType.SIMULATION_STEP, StepEventData(step_counter))
-            pressed_key = keyboard.getKey()
-
-            try:
-                simulationKeyResult = simulationKeyboardController.execute(pressed_key)
-            except Exception as e:
-                print("Simulation keyboard handler error:", e)
-                simulationKeyResult = None
-
-            lock_acquired = robotLock.acquire(blocking=False)
-            if lock_acquired:
+            stepEvent.step = step_counter
+            eventManager.notify(EventType.SIMULATION_STEP, stepEvent)
+            # drain every key Webots reports for this step so simultaneous presses are not dropped
+            pressed_keys = []
+            while (key := keyboard.getKey()) != -1:
+                if key not in pressed_keys:
+                    pressed_keys.append(key)
+            pressed_key = pressed_keys[0] if pressed_keys else -1
+
+            # no onNoKey handler is registered on the simulation controller, so idle steps skip it entirely
+            for key in pressed_keys:
                 try:
-                    keyboard_result = robotKeyboardController.execute(pressed_key)
+                    simulationKeyboardController.execute(key)
                 except Exception as e:
-                    robotLock.release()
-                    print("Keyboard handler error:", e)
-                    keyboard_result = None
+                    print("Simulation keyboard handler error:", e)
 
-                if isinstance(keyboard_result, Future):
-                    keyboard_result.add_done_callback(lambda _f: robotLock.release())
-                else:
-                    robotLock.release()
+            if robotTask is None or robotTask.done():
+                keyboard_result = False
+                if pressed_key != -1:
+                    try:
+                        keyboard_result = robotKeyboardController.execute(pressed_key)
+                    except Exception as e:
+                        print("Keyboard handler error:", e)
+                        keyboard_result = None
 
-                if keyboard_result is False and not simulationLock.locked():
-                    robot.stop()
+                if isinstance(keyboard_result, Future):
+                    robotTask = keyboard_result
+                    robotStopped = False
+                elif keyboard_result is False:
+                    if simulationLock.locked():
+                        robotStopped = False
+                    elif not robotStopped:
+                        # stop once when keys are released instead of re-sending stop on every idle step
+                        robot.stop()
+                        robotStopped = True
 
-            # reuse pressed_key instead of calling getKey() again
-            handle_keyboard_input(pressed_key, robot, initialPose)
             step_counter += 1
         except Exception as e:
-            robotLock.release()
             print("Error during simulation step:", e)
     cv2.destroyAllWindows()
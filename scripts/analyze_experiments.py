@@ -10,10 +10,14 @@ scores       Compute and print scoring data (distance + heading) per experiment.
 Replaces: analyze_iterations.py, get_scores.py
 """
 
-import json
 import os
 import argparse
+import fnmatch
+import mmap
+import re
+import orjson
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List, Optional, Tuple
@@ -23,6 +27,14 @@ from typing import Dict, List, Optional, Tuple
 # iterations  –  originally analyze_iterations.py
 # ---------------------------------------------------------------------------
 
+# Standard names only: the model cannot contain or end in "experiment" (so the split parse would
+# pick the same model) and ".json" may only appear as the extension; anything else is split-parsed.
+EXPERIMENT_FILENAME_RE = re.compile(
+    r'^(?!.*\.json.)[^_]*_pos_(?P<pos>[^_]*)_experiment_'
+    r'(?P<model>(?:(?!experiment_).)*)(?<!experiment)_(?P<ts>[^_.]*)\.json$'
+)
+
+
 def extract_experiment_info(filename: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Extract (position, model, timestamp) from a standard experiment filename.
@@ -30,6 +42,14 @@ def extract_experiment_info(filename: str) -> Tuple[Optional[str], Optional[str]
     Expected pattern: ``<id>_pos_<n>_experiment_<model>_<timestamp>.json``
     Returns (None, None, None) on parse failure.
     """
+    m = EXPERIMENT_FILENAME_RE.match(filename)
+    if m:
+        return m['pos'], m['model'], m['ts']
+    return _split_experiment_info(filename)
+
+
+def _split_experiment_info(filename: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """General split-based parse, used for names EXPERIMENT_FILENAME_RE does not accept."""
     parts = filename.replace('.json', '').split('_')
     if len(parts) >= 4 and parts[1] == 'pos':
         position = parts[2]
@@ -43,33 +63,70 @@ def extract_experiment_info(filename: str) -> Tuple[Optional[str], Optional[str]
     return None, None, None
 
 
+NUM_ITERS_RE = re.compile(rb'"numberOfIterations"\s*:\s*(\d+)')
+
+
+def _read_iteration_count(path: str) -> Tuple[int, Optional[str]]:
+    """
+    Return (numberOfIterations, None), or (0, error message) if the file cannot be read.
+
+    The count is scanned straight from the raw bytes; the file is only fully
+    parsed when the key is missing or not a plain integer.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    match = NUM_ITERS_RE.search(data)
+                    if match:
+                        return int(match.group(1)), None
+        return orjson.loads(Path(path).read_bytes()).get('numberOfIterations', 0), None
+    except Exception as e:
+        return 0, str(e)
+
+
+def _task_dirs(experiments_dir: Path) -> List[os.DirEntry]:
+    """Ablation_* directories of experiments_dir, sorted by name."""
+    with os.scandir(experiments_dir) as it:
+        dirs = [e for e in it if e.name.startswith('Ablation_') and e.is_dir()]
+    return sorted(dirs, key=lambda e: e.name)
+
+
+def _scan_files(task_dir: os.DirEntry, pattern: str) -> List[os.DirEntry]:
+    """Entries of task_dir whose name matches the glob pattern, without stat-ing the others."""
+    with os.scandir(task_dir.path) as it:
+        return [e for e in it if fnmatch.fnmatchcase(e.name, pattern)]
+
+
 def collect_iteration_counts(experiments_dir: Path) -> Dict:
     """
     Walk Ablation_* directories and collect iteration counts.
 
+    Files are parsed in parallel worker processes.
     Returns a nested dict: task → position → list of run_info dicts.
     """
     results = defaultdict(lambda: defaultdict(list))
 
-    task_dirs = sorted(d for d in experiments_dir.iterdir()
-                       if d.is_dir() and d.name.startswith('Ablation_'))
-
-    for task_dir in task_dirs:
-        for json_file in task_dir.glob('*_pos_*.json'):
-            try:
-                position, model, timestamp = extract_experiment_info(json_file.name)
-                if position is None:
-                    continue
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
-                results[task_dir.name][position].append({
-                    'filename': json_file.name,
-                    'model': model,
-                    'timestamp': timestamp,
-                    'iterations': data.get('numberOfIterations', 0),
-                })
-            except Exception as e:
-                print(f"Error reading {json_file}: {e}")
+    runs = []
+    for task_dir in _task_dirs(experiments_dir):
+        for json_file in _scan_files(task_dir, '*_pos_*.json'):
+            position, model, timestamp = extract_experiment_info(json_file.name)
+            if position is None:
+                continue
+            runs.append((task_dir.name, position, model, timestamp, json_file))
+
+    with ProcessPoolExecutor() as pool:
+        counts = pool.map(_read_iteration_count, [run[-1].path for run in runs], chunksize=32)
+        for (task_name, position, model, timestamp, json_file), (iterations, error) in zip(runs, counts):
+            if error is not None:
+                print(f"Error reading {json_file.path}: {error}")
+                continue
+            results[task_name][position].append({
+                'filename': json_file.name,
+                'model': model,
+                'timestamp': timestamp,
+                'iterations': iterations,
+            })
 
     return results
 
@@ -96,8 +153,15 @@ def print_iteration_summary(results: Dict) -> None:
 
     for task_name in sorted(results):
         positions = results[task_name]
-        total_runs = sum(len(runs) for runs in positions.values())
-        total_iters = sum(r['iterations'] for runs in positions.values() for r in runs)
+        # single pass: per-position (runs, iterations) plus the task totals
+        per_position = {}
+        total_runs = 0
+        total_iters = 0
+        for position, runs in positions.items():
+            pos_iters = sum(r['iterations'] for r in runs)
+            per_position[position] = (len(runs), pos_iters)
+            total_runs += len(runs)
+            total_iters += pos_iters
         avg = total_iters / total_runs if total_runs > 0 else 0
 
         print(f"\n{task_name}:")
@@ -105,11 +169,10 @@ def print_iteration_summary(results: Dict) -> None:
         print(f"  Total iterations: {total_iters}")
         print(f"  Average per run: {avg:.2f}")
 
-        for position in sorted(positions, key=lambda x: int(x)):
-            runs = positions[position]
-            pos_iters = sum(r['iterations'] for r in runs)
-            pos_avg = pos_iters / len(runs) if runs else 0
-            print(f"    Position {position}: {len(runs)} runs, "
+        for position in sorted(per_position, key=lambda x: int(x)):
+            run_count, pos_iters = per_position[position]
+            pos_avg = pos_iters / run_count if run_count else 0
+            print(f"    Position {position}: {run_count} runs, "
                   f"{pos_iters} total, {pos_avg:.2f} avg")
 
 
@@ -140,15 +203,23 @@ def calculate_score(distance: float, angle: Optional[float]) -> float:
     return calculate_distance_score(distance) * calculate_heading_score(angle)
 
 
-def cmd_scores(experiments_dir: Path) -> None:
-    task_dirs = sorted(d for d in experiments_dir.iterdir()
-                       if d.is_dir() and d.name.startswith('Ablation_'))
+def calculate_scores(distances: np.ndarray, angles: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorised calculate_distance_score / calculate_heading_score / calculate_score.
+
+    Missing angles are passed as NaN and score 0, like ``None`` in the scalar versions.
+    """
+    d_scores = np.where(distances <= 2.5, 1.0, 1.5 ** -np.maximum(distances - 2.5, 0.0))
+    h_scores = np.where(np.isnan(angles), 0.0, (np.pi - np.deg2rad(angles)) / np.pi)
+    return d_scores, h_scores, d_scores * h_scores
+
 
+def cmd_scores(experiments_dir: Path) -> None:
     heading_printed = False
 
-    for task_dir in task_dirs:
+    for task_dir in _task_dirs(experiments_dir):
         json_files = sorted(
-            task_dir.glob('*_pos_*_experiment_gemini-2_0-*.json'),
+            _scan_files(task_dir, '*_pos_*_experiment_gemini-2_0-*.json'),
             key=lambda x: int(x.name.split('_')[0]),
         )
 
@@ -157,8 +228,8 @@ def cmd_scores(experiments_dir: Path) -> None:
 
         for json_file in json_files:
             try:
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
+                with open(json_file.path, 'rb') as f:
+                    data = orjson.loads(f.read())
                 iterations = data.get('iterations', [])
                 if not iterations:
                     print()
@@ -176,12 +247,12 @@ def cmd_scores(experiments_dir: Path) -> None:
                     ))
                     heading_printed = True
 
-                for entry in scoring_data:
-                    distance = entry.get('distance')
-                    angle = entry.get('angle')
-                    d_score = calculate_distance_score(distance)
-                    h_score = calculate_heading_score(angle)
-                    score = calculate_score(distance, angle)
+                count = len(scoring_data)
+                distances = np.fromiter((entry.get('distance') for entry in scoring_data),
+                                        dtype=np.float64, count=count)
+                angles = np.fromiter((np.nan if (a := entry.get('angle')) is None else a
+                                      for entry in scoring_data), dtype=np.float64, count=count)
+                for d_score, h_score, score in zip(*calculate_scores(distances, angles)):
                     print(f"{d_score:.4f}", f"{h_score:.4f}", f"{score:.4f}",
                           sep='\t', end='\t')
                 print()
@@ -3,9 +3,13 @@ Cut frontier paths when the robot gets within 2.5m of the target.
 Uses the target_map to determine target coordinates based on prompt keywords.
 """
 
-import json
 import os
-import math
+import re
+import sys
+import orjson
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Target map with keywords and their coordinates
@@ -22,14 +26,13 @@ target_map = {
 
 DISTANCE_THRESHOLD = 2.5  # meters
 
-
-def calculate_distance(x1, y1, x2, y2):
-    """Calculate Euclidean distance between two points."""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+# leading numeric id of "1_pos_1_experiment_gemini-2_0-flash_20251118-095910"
+_LEAD_INT = re.compile(r'(\d+)')
 
 
+@lru_cache(maxsize=None)
 def find_target_coordinates(prompt):
-    """Find target coordinates based on prompt keywords."""
+    """Find target coordinates based on prompt keywords (first keyword in target_map order wins)."""
     prompt_lower = prompt.lower()
     for keyword, coords in target_map.items():
         if keyword in prompt_lower:
@@ -42,17 +45,23 @@ def cut_path_at_target(path, target_x, target_y, threshold=DISTANCE_THRESHOLD):
     Cut the path when the robot gets within threshold distance of the target.
     Returns the cut path and the index where it was cut.
     """
-    for i, waypoint in enumerate(path):
-        x = waypoint['x']
-        y = waypoint['y']
-        distance = calculate_distance(x, y, target_x, target_y)
-        
-        if distance <= threshold:
-            # Cut the path at this point (include this waypoint)
-            return path[:i + 1], i
-    
-    # If never within threshold, return the full path
-    return path, len(path) - 1
+    xs = np.fromiter((waypoint['x'] for waypoint in path), dtype=np.float64, count=len(path))
+    ys = np.fromiter((waypoint['y'] for waypoint in path), dtype=np.float64, count=len(path))
+    # squared distances against the squared threshold, no sqrt needed
+    within = (xs - target_x) ** 2 + (ys - target_y) ** 2 <= threshold * threshold
+
+    if not within.any():
+        # If never within threshold, return the full path
+        return path, len(path) - 1
+
+    # Cut the path at the first waypoint within threshold (include this waypoint)
+    i = int(within.argmax())
+    return path[:i + 1], i
+
+
+def _write_json(item):
+    filepath, data = item
+    filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
 def process_frontier_paths():
@@ -60,14 +69,14 @@ def process_frontier_paths():
     
     # Load experiments list to get simulation_id to prompt mapping
     experiments_file = 'experiments/frontier_experiments_list.json'
-    with open(experiments_file, 'r') as f:
-        experiments = json.load(f)
+    with open(experiments_file, 'rb') as f:
+        experiments = orjson.loads(f.read())
     
-    # Create a mapping from simulation_id to prompt
+    # Create a mapping from the integer simulation_id to prompt
     sim_id_to_prompt = {}
     for exp in experiments:
         # Extract base simulation_id (without _pos_X suffix)
-        sim_id = exp['simulation_id']
+        sim_id = int(str(exp['simulation_id']).split('_', 1)[0])
         sim_id_to_prompt[sim_id] = exp['prompt']
     
     # Process each frontier path file
@@ -80,25 +89,28 @@ def process_frontier_paths():
         'files_no_target': 0,
         'waypoints_removed': 0
     }
+    to_write = []
+    # per-file messages are emitted in one write after the loop
+    log_lines = []
     
     for filepath in sorted(frontier_paths_dir.glob('frontier_exploration_*.json')):
         stats['total_files'] += 1
         
         # Load the frontier path file
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = orjson.loads(filepath.read_bytes())
         
         # Extract simulation_id from the filename or simulation_id field
         simulation_id_str = data.get('simulation_id', '')
         
         # Extract the numeric ID from strings like "1_pos_1_experiment_gemini-2_0-flash_20251118-095910"
-        sim_id = int(simulation_id_str.split('_')[0])
+        match = _LEAD_INT.match(str(simulation_id_str))
+        sim_id = int(match.group(1)) if match else None
         
         # Get the prompt for this simulation
         prompt = sim_id_to_prompt.get(sim_id)
         
         if not prompt:
-            print(f"Warning: No prompt found for simulation_id {sim_id} in {filepath.name}")
+            log_lines.append(f"Warning: No prompt found for simulation_id {sim_id} in {filepath.name}")
             stats['files_no_target'] += 1
             continue
         
@@ -106,7 +118,7 @@ def process_frontier_paths():
         target_coords = find_target_coordinates(prompt)
         
         if not target_coords:
-            print(f"Warning: No target found for prompt '{prompt}' in {filepath.name}")
+            log_lines.append(f"Warning: No target found for prompt '{prompt}' in {filepath.name}")
             stats['files_no_target'] += 1
             continue
         
@@ -124,8 +136,8 @@ def process_frontier_paths():
             stats['files_cut'] += 1
             stats['waypoints_removed'] += waypoints_removed
             
-            print(f"Cut {filepath.name}: {original_length} -> {len(cut_path)} waypoints "
-                  f"(removed {waypoints_removed}) for prompt: '{prompt}'")
+            log_lines.append(f"Cut {filepath.name}: {original_length} -> {len(cut_path)} waypoints "
+                             f"(removed {waypoints_removed}) for prompt: '{prompt}'")
             
             # Update the data
             data['path'] = cut_path
@@ -135,12 +147,17 @@ def process_frontier_paths():
             data['target_coordinates'] = {'x': target_x, 'y': target_y}
             data['prompt'] = prompt
             
-            # Save the modified file
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            to_write.append((filepath, data))
         else:
             stats['files_not_cut'] += 1
-            print(f"No cut needed for {filepath.name} (never within {DISTANCE_THRESHOLD}m of target)")
+            log_lines.append(f"No cut needed for {filepath.name} (never within {DISTANCE_THRESHOLD}m of target)")
+    
+    # Save the modified files, orjson releases the GIL so the writes overlap
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_write_json, to_write))
+
+    if log_lines:
+        sys.stdout.write('\n'.join(log_lines) + '\n')
     
     # Print summary statistics
     print("\n" + "=" * 70)
@@ -1,6 +1,10 @@
-import json
-import os
+import orjson
 from pathlib import Path
+try:
+    from scripts.json_io import load_json
+except ModuleNotFoundError:
+    # run directly as scripts/<name>.py: the scripts directory itself is on sys.path
+    from json_io import load_json
 
 # Directory containing the experiment files
 experiments_dir = Path("/Users/kelvin/Documents/Projects/webots_robot_controllers/experiments")
@@ -15,8 +19,7 @@ print(f"Found {len(json_files)} files to process...")
 
 for json_file in json_files:
     try:
-        with open(json_file, 'r') as f:
-            data = json.load(f)
+        data = load_json(json_file)
         
         # Extract required information
         experiment_info = {
@@ -38,8 +41,8 @@ for json_file in json_files:
 
 # Save to failed_experiment.json
 output_file = experiments_dir.parent / "failed_experiment.json"
-with open(output_file, 'w') as f:
-    json.dump(failed_experiments, f, indent=2)
+with open(output_file, 'wb') as f:
+    f.write(orjson.dumps(failed_experiments, option=orjson.OPT_INDENT_2))
 
 print(f"\nProcessed {len(failed_experiments)} experiments")
 print(f"Results saved to: {output_file}")
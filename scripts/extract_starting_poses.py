@@ -5,9 +5,19 @@ Each experiment is saved with its task, target position, and starting pose.
 """
 
 import os
-import json
+import argparse
+import orjson
 import glob
+import shelve
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from tqdm import tqdm
+try:
+    from scripts.json_io import load_json
+except ModuleNotFoundError:
+    # run directly as scripts/<name>.py: the scripts directory itself is on sys.path
+    from json_io import load_json
 
 # Target positions and labels
 targets = [ 
@@ -34,6 +44,17 @@ target_map = {
         'fire': 'FIRE_EXTINGUISHER',
     }
 
+# keyword -> target dict, resolved once against the targets list (keeps target_map order)
+keyword_targets = {
+    keyword: {'name': name, 'x': x, 'y': y}
+    for keyword, target_name in target_map.items()
+    for x, y, name in targets
+    if name == target_name
+}
+
+# Simulation IDs kept by extract_all_experiments: 1, 5, 9, ..., 197
+ALLOWED_SIM_IDS = frozenset(range(1, 200, 4))
+
 def extract_simulation_id(filename: str) -> int:
     """
     Extract the simulation ID (first number) from the experiment filename.
@@ -42,8 +63,7 @@ def extract_simulation_id(filename: str) -> int:
     """
     basename = os.path.basename(filename)
     # Extract the first number before the first underscore
-    first_part = basename.split('_')[0]
-    return int(first_part)
+    return int(basename.partition('_')[0])
 
 
 def extract_experiment_id(filename: str) -> str:
@@ -55,6 +75,8 @@ def extract_experiment_id(filename: str) -> str:
              -> "1_pos_1_experiment_gemini-2_0-flash_20251118-095910"
     """
     basename = os.path.basename(filename)
+    if basename.endswith('.json'):
+        return basename[:-5]
     return os.path.splitext(basename)[0]
 
 
@@ -81,17 +103,10 @@ def find_target_for_task(task_name: str, prompt: str) -> dict:
     # Convert prompt to lowercase for matching
     prompt_lower = prompt.lower()
     
-    # Try to find matching target using the target_map
-    for keyword, target_name in target_map.items():
+    # Try to find matching target using the target_map, first keyword wins
+    for keyword, target in keyword_targets.items():
         if keyword in prompt_lower:
-            # Find the target coordinates from the targets list
-            for x, y, name in targets:
-                if name == target_name:
-                    return {
-                        'name': name,
-                        'x': x,
-                        'y': y
-                    }
+            return dict(target)
     
     # If no specific target found, return None (for tasks like "look around", "360 turn")
     return None
@@ -113,14 +128,18 @@ def poses_are_similar(pose1: dict, pose2: dict, position_threshold: float = 0.01
     rot1 = pose1['rotation']
     rot2 = pose2['rotation']
     
-    # Check position similarity (Euclidean distance)
-    position_distance = sum((p1 - p2) ** 2 for p1, p2 in zip(pos1, pos2)) ** 0.5
-    if position_distance > position_threshold:
+    # Check position similarity (squared Euclidean distance against the squared threshold)
+    position_distance_sq = 0.0
+    for p1, p2 in zip(pos1, pos2):
+        position_distance_sq += (p1 - p2) * (p1 - p2)
+    if position_distance_sq > position_threshold * position_threshold:
         return False
     
     # Check rotation similarity (component-wise difference)
-    rotation_distance = sum((r1 - r2) ** 2 for r1, r2 in zip(rot1, rot2)) ** 0.5
-    if rotation_distance > rotation_threshold:
+    rotation_distance_sq = 0.0
+    for r1, r2 in zip(rot1, rot2):
+        rotation_distance_sq += (r1 - r2) * (r1 - r2)
+    if rotation_distance_sq > rotation_threshold * rotation_threshold:
         return False
     
     return True
@@ -132,8 +151,7 @@ def extract_experiment_data(experiment_file: str) -> dict:
     
     Returns a dict with pose, task, prompt, and target information.
     """
-    with open(experiment_file, 'r') as f:
-        experiment_data = json.load(f)
+    experiment_data = load_json(experiment_file)
     
     initial_pose = experiment_data['initialRobotPose']['pose']
     task = extract_task_from_path(experiment_file)
@@ -153,28 +171,53 @@ def extract_experiment_data(experiment_file: str) -> dict:
     }
 
 
-def extract_all_experiments(experiments_dir: str) -> dict:
+# Optional on-disk cache of extract_experiment_data results (--cache / --cache-path), keyed by
+# file path, mtime and size; entries are never evicted, delete the file to reset it.
+# Bump EXTRACT_CACHE_VERSION when the extracted fields or the target tables change.
+EXTRACT_CACHE_PATH = os.path.expanduser('~/.cache/webots_extract.db')
+EXTRACT_CACHE_VERSION = 1
+
+
+def _cache_key(experiment_file: str) -> str:
+    st = os.stat(experiment_file)
+    return f"{EXTRACT_CACHE_VERSION}:{os.path.abspath(experiment_file)}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _extract_worker(experiment_file: str) -> tuple:
+    """Worker for extract_all_experiments: (exp_id, data, None), or (exp_id, None, error message)."""
+    exp_id = extract_experiment_id(experiment_file)
+    try:
+        return exp_id, extract_experiment_data(experiment_file), None
+    except Exception as e:
+        return exp_id, None, str(e)
+
+
+def _scan_experiment_files(directory: str):
+    """Recursively yield experiment JSON paths below directory, filtering on entry names only."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_experiment_files(entry.path)
+            elif entry.name.endswith('.json') and not entry.name.endswith('_metrics.json'):
+                yield entry.path
+
+
+def extract_all_experiments(experiments_dir: str, cache_path: str = None) -> dict:
     """
     Extract data from all experiment files in the experiments directory.
     Only keeps experiments with simulation IDs in range(1, 320, 4): 1, 5, 9, 13, ..., 317
+    With cache_path, results of unchanged files are reused from that shelve file.
     
     Returns a dict mapping unique experiment ID to experiment data.
     """
     experiments = {}
     
-    # Define the allowed simulation IDs
-    allowed_sim_ids = set(range(1, 200, 4))
-    
     # Find all JSON files in subdirectories (but not the metrics files in root)
     experiment_files = []
-    for root, dirs, files in os.walk(experiments_dir):
-        # Skip the root experiments directory
-        if root == experiments_dir:
-            continue
-        
-        for file in files:
-            if file.endswith('.json') and not file.endswith('_metrics.json'):
-                experiment_files.append(os.path.join(root, file))
+    with os.scandir(experiments_dir) as it:
+        subdirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+    for subdir in subdirs:
+        experiment_files.extend(_scan_experiment_files(subdir))
     
     # Sort files to ensure consistent ordering
     experiment_files.sort()
@@ -183,23 +226,49 @@ def extract_all_experiments(experiments_dir: str) -> dict:
     print(f"Filtering to keep only simulation IDs: 1, 5, 9, 13, ... (every 4th)")
     
     skipped_count = 0
+    selected = []
     for experiment_file in experiment_files:
         try:
             sim_id = extract_simulation_id(experiment_file)
-            
-            # Only process if simulation ID is in our allowed set
-            if sim_id not in allowed_sim_ids:
-                skipped_count += 1
-                continue
-            
-            exp_id = extract_experiment_id(experiment_file)
-            exp_data = extract_experiment_data(experiment_file)
-            
-            experiments[exp_id] = exp_data
-            print(f"  Extracted data for experiment {exp_id} (sim_id: {sim_id})")
         except Exception as e:
             print(f"  Error processing {experiment_file}: {e}")
             continue
+        
+        # Only process if simulation ID is in our allowed set
+        if sim_id not in ALLOWED_SIM_IDS:
+            skipped_count += 1
+            continue
+        selected.append((experiment_file, sim_id))
+    
+    if cache_path is None:
+        cache_context = nullcontext({})
+    else:
+        print(f"Using extraction cache: {cache_path}")
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+        cache_context = shelve.open(cache_path)
+    with cache_context as cache:
+        keys = [_cache_key(f) if cache_path is not None else None for f, _ in selected]
+        # Only files changed since the last run are parsed, in worker processes
+        misses = [f for (f, _), key in zip(selected, keys) if key not in cache]
+        parsed = {}
+        if misses:
+            with ProcessPoolExecutor() as pool:
+                results = pool.map(_extract_worker, misses, chunksize=32)
+                parsed = {f: r for r, f in zip(tqdm(results, total=len(misses), desc="Parsing"), misses)}
+        
+        for (experiment_file, _), key in zip(selected, keys):
+            if experiment_file in parsed:
+                exp_id, exp_data, error = parsed[experiment_file]
+                if error is None and cache_path is not None:
+                    cache[key] = exp_data
+            else:
+                exp_id, exp_data, error = extract_experiment_id(experiment_file), cache[key], None
+            if error is not None:
+                print(f"  Error processing {experiment_file}: {error}")
+                continue
+            experiments[exp_id] = exp_data
+    
+    print(f"Extracted data for {len(experiments)} experiments")
     
     print(f"\nSkipped {skipped_count} experiments (not in selected range)")
     
@@ -207,6 +276,14 @@ def extract_all_experiments(experiments_dir: str) -> dict:
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Extract robot starting poses from experiment files.')
+    parser.add_argument('--cache', action='store_true',
+                        help=f'Reuse results for unchanged files from a cache at {EXTRACT_CACHE_PATH}.')
+    parser.add_argument('--cache-path', type=str, default=None,
+                        help='Cache file location (implies --cache).')
+    args = parser.parse_args()
+    cache_path = args.cache_path or (EXTRACT_CACHE_PATH if args.cache else None)
+
     # Path to the experiments directory
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
@@ -218,14 +295,14 @@ def main():
     print()
     
     # Extract all experiment data
-    experiments = extract_all_experiments(str(experiments_dir))
+    experiments = extract_all_experiments(str(experiments_dir), cache_path)
     
     # Sort by experiment ID for cleaner output
     sorted_experiments = dict(sorted(experiments.items()))
     
     # Save to JSON file
-    with open(output_file, 'w') as f:
-        json.dump(sorted_experiments, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(sorted_experiments, option=orjson.OPT_INDENT_2))
     
     print()
     print(f"Successfully extracted {len(sorted_experiments)} experiments")
@@ -1,22 +1,41 @@
-import json
 import os
+import re
 import csv
+import numpy as np
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Tuple
-from scripts.visualize_paths import visualize_frontier_path, obstacles
+from tqdm import tqdm
+from scripts.json_io import load_json
+from scripts.visualize_paths import FrontierCanvas, visualize_frontier_path, obstacles
 
-def load_json(filepath: str) -> Dict:
-    """Load JSON data from file."""
-    with open(filepath, 'r') as f:
-        return json.load(f)
+# "<n>_..._pos_<p>_..." -> (n, p); the first "pos" token is the one that counts
+EXPERIMENT_FILENAME_RE = re.compile(r'^(\d+)_(?:[^_]*_)*?pos_([^_]*)')
+POS_TOKEN_RE = re.compile(r'(?:^|_)pos_([^_]*)')
 
 def extract_pos_from_filename(filename: str) -> str:
     """Extract position number from filename (e.g., 'pos_1')."""
-    parts = filename.split('_')
-    for i, part in enumerate(parts):
-        if part == 'pos' and i + 1 < len(parts):
-            return f"pos_{parts[i+1]}"
-    return None
+    m = POS_TOKEN_RE.search(filename)
+    return f"pos_{m.group(1)}" if m else None
+
+FRONTIER_FILENAME_RE = re.compile(r'^frontier_exploration_(\d+)_pos_([^_]*)_experiment_')
+
+@lru_cache(maxsize=None)
+def index_frontier_files(frontier_dir: Path) -> Dict[str, Dict[str, str]]:
+    """Map position -> base experiment number -> frontier file path, scanning frontier_dir once."""
+    index = defaultdict(dict)
+    if not frontier_dir.is_dir():
+        return index
+    with os.scandir(frontier_dir) as it:
+        for entry in it:
+            m = FRONTIER_FILENAME_RE.match(entry.name)
+            if m:
+                index[m.group(2)].setdefault(m.group(1), entry.path)
+    return index
 
 def find_matching_frontier(task_filename: str, frontier_dir: Path) -> str:
     """Find the matching frontier exploration file for a task experiment.
@@ -29,38 +48,20 @@ def find_matching_frontier(task_filename: str, frontier_dir: Path) -> str:
     - Experiments [17-20]_pos_5 -> frontier_exploration_17_pos_5
     And so on for subsequent groups...
     """
-    # Extract experiment number from filename
+    # Extract experiment number and position from filename
     # Example: "1_pos_1_experiment_gemini-2_0-flash_20251118-095910.json"
-    exp_num_str = task_filename.split('_')[0]
-    
-    try:
-        exp_num = int(exp_num_str)
-    except ValueError:
+    m = EXPERIMENT_FILENAME_RE.match(task_filename)
+    if m is None:
         return None
+    exp_num, pos_idx = int(m.group(1)), m.group(2)
     
     # Calculate the base frontier number
     # For exp 1-4: base = 1, for exp 5-8: base = 5, etc.
     base_frontier_num = ((exp_num - 1) // 4) * 4 + 1
     
-    # Extract position from filename (e.g., "pos_1")
-    parts = task_filename.split('_')
-    pos_idx = None
-    for i, part in enumerate(parts):
-        if part == 'pos' and i + 1 < len(parts):
-            pos_idx = parts[i + 1]
-            break
-    
-    if pos_idx is None:
-        return None
-    
-    # Look for frontier file matching the pattern
-    pattern = f"frontier_exploration_{base_frontier_num}_pos_{pos_idx}_experiment_*"
-    matching_files = list(frontier_dir.glob(pattern))
-    
-    if matching_files:
-        return str(matching_files[0])
-    
-    return None
+    # Look up the frontier file matching frontier_exploration_<base>_pos_<pos>_experiment_*
+    by_base = index_frontier_files(frontier_dir).get(pos_idx)
+    return by_base.get(str(base_frontier_num)) if by_base else None
 
 def extract_path_from_frontier(frontier_data: Dict) -> List[Tuple[float, float]]:
     """Extract path waypoints from frontier exploration data."""
@@ -82,29 +83,108 @@ def calculate_path_length(path: List[Tuple[float, float]]) -> float:
     if len(path) < 2:
         return 0.0
     
-    total_length = 0.0
-    for i in range(len(path) - 1):
-        x1, y1 = path[i]
-        x2, y2 = path[i + 1]
-        distance = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
-        total_length += distance
-    
-    return total_length
+    points = np.asarray(path, dtype=np.float64)
+    return float(np.hypot(*np.diff(points, axis=0).T).sum())
+
+def robot_path_positions(experiment_data: Dict) -> np.ndarray:
+    """(N, 2) array of the starting position followed by every iteration end position."""
+    xy = itemgetter('x', 'y')
+    iterations = experiment_data['iterations']
+    positions = np.empty((len(iterations) + 1, 2), dtype=np.float64)
+    positions[0] = xy(experiment_data['initialRobotPose']['position'])
+    if iterations:
+        positions[1:] = [xy(iteration['endRobotStatus']['position']) for iteration in iterations]
+    return positions
 
 def calculate_robot_path_length(experiment_data: Dict) -> float:
     """Calculate total path length from robot experiment data."""
-    positions = []
-    
-    # Add starting position
-    starting_pos = experiment_data['initialRobotPose']['position']
-    positions.append((starting_pos['x'], starting_pos['y']))
-    
-    # Add all iteration end positions
-    for iteration in experiment_data['iterations']:
-        pose = iteration['endRobotStatus']['position']
-        positions.append((pose['x'], pose['y']))
+    return calculate_path_length(robot_path_positions(experiment_data))
+
+def _init_worker():
+    # workers only render to files
+    import matplotlib
+    matplotlib.use('Agg')
+
+def process_task_folder(task_folder: str, frontier_dir: Path, output_dir: Path) -> Tuple[List[Dict], int, int, List[str]]:
+    """
+    Generate the comparison images of one TASK folder.
+
+    Returns (csv rows, processed count, matched count, warning/error messages).
+    """
+    task_name = os.path.basename(task_folder)
+    rows = []
+    messages = []
+    processed = 0
+    matched = 0
+    
+    # One figure for the whole folder: obstacles and targets are drawn once, paths are redrawn per image
+    canvas = FrontierCanvas(obstacles)
+    
+    # Get all experiment JSON files in this task folder, as (name, path) pairs
+    with os.scandir(task_folder) as it:
+        experiment_files = sorted((e.name, e.path) for e in it
+                                  if e.name.endswith('.json') and not e.name.startswith('.'))
+    
+    for exp_name, exp_path in experiment_files:
+        exp_stem = exp_name[:-5]
+        # Find matching frontier file
+        frontier_file = find_matching_frontier(exp_name, frontier_dir)
+        
+        if not frontier_file:
+            messages.append(f"  ⚠️  No matching frontier for {exp_name}")
+            continue
+        
+        try:
+            # Load data
+            experiment_data = load_json(exp_path)
+            frontier_data = load_json(frontier_file)
+            
+            # Extract path information
+            frontier_path = extract_path_from_frontier(frontier_data)
+            start, goal = get_start_goal_from_frontier(frontier_data)
+            
+            # Walk the robot iterations once, for both the path length and the plot
+            robot_positions = robot_path_positions(experiment_data)
+            
+            # Calculate path lengths
+            robot_path_length = calculate_path_length(robot_positions)
+            frontier_path_length = calculate_path_length(frontier_path)
+            
+            # Add to CSV data
+            rows.append({
+                'TASK': task_name,
+                'simulation_id': exp_stem,
+                'robot_path_length': round(robot_path_length, 4),
+                'frontier_path_length': round(frontier_path_length, 4)
+            })
+            
+            # Generate output filename
+            output_filename = f"{task_name}_{exp_stem}.png"
+            output_path = output_dir / output_filename
+            
+            # Generate visualization
+            title = f"{task_name} - {exp_stem}"
+            visualize_frontier_path(
+                start=start,
+                goal=goal,
+                path=frontier_path,
+                obstacle_list=obstacles,
+                save_path=str(output_path),
+                experiment_data=experiment_data,
+                title=title,
+                canvas=canvas,
+                robot_path_xy=(robot_positions[:, 0].tolist(), robot_positions[:, 1].tolist())
+            )
+            
+            matched += 1
+            
+        except Exception as e:
+            messages.append(f"  ✗ Error processing {exp_name}: {e}")
+        
+        processed += 1
     
-    return calculate_path_length(positions)
+    canvas.close()
+    return rows, processed, matched, messages
 
 def generate_all_comparisons():
     """Generate comparison images for all TASK experiments."""
@@ -116,82 +196,32 @@ def generate_all_comparisons():
     output_dir.mkdir(exist_ok=True)
     
     # Find all TASK folders
-    task_folders = sorted([d for d in base_dir.iterdir() if d.is_dir() and d.name.startswith('TASK_')])
+    with os.scandir(base_dir) as it:
+        task_folders = sorted(e.path for e in it if e.is_dir() and e.name.startswith('TASK_'))
     
     print(f"Found {len(task_folders)} TASK folders")
     
     total_processed = 0
     total_matched = 0
     
-    # Prepare CSV data
-    csv_data = []
-    
-    for task_folder in task_folders:
-        print(f"\nProcessing {task_folder.name}...")
-        
-        # Get all experiment JSON files in this task folder
-        experiment_files = sorted(task_folder.glob('*.json'))
-        
-        for exp_file in experiment_files:
-            # Find matching frontier file
-            frontier_file = find_matching_frontier(exp_file.name, frontier_dir)
-            
-            if not frontier_file:
-                print(f"  ⚠️  No matching frontier for {exp_file.name}")
-                continue
-            
-            try:
-                # Load data
-                experiment_data = load_json(exp_file)
-                frontier_data = load_json(frontier_file)
-                
-                # Extract path information
-                frontier_path = extract_path_from_frontier(frontier_data)
-                start, goal = get_start_goal_from_frontier(frontier_data)
-                
-                # Calculate path lengths
-                robot_path_length = calculate_robot_path_length(experiment_data)
-                frontier_path_length = calculate_path_length(frontier_path)
-                
-                # Add to CSV data
-                csv_data.append({
-                    'TASK': task_folder.name,
-                    'simulation_id': exp_file.stem,
-                    'robot_path_length': round(robot_path_length, 4),
-                    'frontier_path_length': round(frontier_path_length, 4)
-                })
-                
-                # Generate output filename
-                output_filename = f"{task_folder.name}_{exp_file.stem}.png"
-                output_path = output_dir / output_filename
-                
-                # Generate visualization
-                title = f"{task_folder.name} - {exp_file.stem}"
-                visualize_frontier_path(
-                    start=start,
-                    goal=goal,
-                    path=frontier_path,
-                    obstacles=obstacles,
-                    save_path=str(output_path),
-                    experiment_data=experiment_data,
-                    title=title
-                )
-                
-                print(f"  ✓ Generated: {output_filename}")
-                total_matched += 1
-                
-            except Exception as e:
-                print(f"  ✗ Error processing {exp_file.name}: {e}")
-            
-            total_processed += 1
-    
-    # Write CSV file
+    # Rows are written as each folder completes, so a crash keeps the results so far
     csv_path = output_dir / 'path_lengths_comparison.csv'
     with open(csv_path, 'w', newline='') as csvfile:
         fieldnames = ['TASK', 'simulation_id', 'robot_path_length', 'frontier_path_length']
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
-        writer.writerows(csv_data)
+        
+        # TASK folders are independent: render them in parallel, results come back in folder order
+        with ProcessPoolExecutor(initializer=_init_worker) as pool:
+            results = pool.map(process_task_folder, task_folders,
+                               repeat(frontier_dir), repeat(output_dir))
+            for rows, processed, matched, messages in tqdm(results, total=len(task_folders), desc="TASK folders"):
+                for message in messages:
+                    tqdm.write(message)
+                writer.writerows(rows)
+                csvfile.flush()
+                total_processed += processed
+                total_matched += matched
     
     print(f"\n{'='*60}")
     print(f"Processed: {total_processed} experiments")
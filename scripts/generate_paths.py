@@ -13,6 +13,7 @@ Replaces: generate_path.py, generate_oracle_paths.py, generate_frontier_oracle_p
 
 import os
 import json
+import math
 import csv
 import glob
 import argparse
@@ -102,12 +103,17 @@ TABLE_OBSTACLE = Rectangle(x=-2.489, y=-5.59, width=4.5, height=1.5)
 obstacles: List[Rectangle] = [TABLE_OBSTACLE]
 
 
+def _segments_intersect_xy(ax: float, ay: float, bx: float, by: float,
+                           cx: float, cy: float, dx: float, dy: float) -> bool:
+    """segments_intersect on plain coordinates, with the ccw tests written out (no tuples, no calls)."""
+    return (((dy - ay) * (cx - ax) > (cy - ay) * (dx - ax)) != ((dy - by) * (cx - bx) > (cy - by) * (dx - bx)) and
+            ((cy - ay) * (bx - ax) > (by - ay) * (cx - ax)) != ((dy - ay) * (bx - ax) > (by - ay) * (dx - ax)))
+
+
 def segments_intersect(p1: Tuple[float, float], p2: Tuple[float, float],
                        p3: Tuple[float, float], p4: Tuple[float, float]) -> bool:
     """Check if line segment p1-p2 intersects with segment p3-p4 (cross-product method)."""
-    def ccw(A, B, C):
-        return (C[1] - A[1]) * (B[0] - A[0]) > (B[1] - A[1]) * (C[0] - A[0])
-    return ccw(p1, p3, p4) != ccw(p2, p3, p4) and ccw(p1, p2, p3) != ccw(p1, p2, p4)
+    return _segments_intersect_xy(p1[0], p1[1], p2[0], p2[1], p3[0], p3[1], p4[0], p4[1])
 
 
 def line_intersects_rectangle(p1: Tuple[float, float], p2: Tuple[float, float],
@@ -124,13 +130,31 @@ def line_intersects_rectangle(p1: Tuple[float, float], p2: Tuple[float, float],
        (rx_min <= x2 <= rx_max and ry_min <= y2 <= ry_max):
         return True
 
-    edges = [
-        ((rx_min, ry_min), (rx_max, ry_min)),
-        ((rx_max, ry_min), (rx_max, ry_max)),
-        ((rx_max, ry_max), (rx_min, ry_max)),
-        ((rx_min, ry_max), (rx_min, ry_min)),
-    ]
-    return any(segments_intersect(p1, p2, e1, e2) for e1, e2 in edges)
+    # the four edges: bottom, right, top, left
+    return (_segments_intersect_xy(x1, y1, x2, y2, rx_min, ry_min, rx_max, ry_min) or
+            _segments_intersect_xy(x1, y1, x2, y2, rx_max, ry_min, rx_max, ry_max) or
+            _segments_intersect_xy(x1, y1, x2, y2, rx_max, ry_max, rx_min, ry_max) or
+            _segments_intersect_xy(x1, y1, x2, y2, rx_min, ry_max, rx_min, ry_min))
+
+
+def _segments_clear_of_rectangle(x1, y1, x2, y2, rect: Rectangle, margin: float = 0.3) -> np.ndarray:
+    """Vectorised ``not line_intersects_rectangle``: coordinates may be scalars or arrays of segment endpoints."""
+    rx_min = rect.x - margin
+    rx_max = rect.x + rect.width + margin
+    ry_min = rect.y - margin
+    ry_max = rect.y + rect.height + margin
+
+    def crosses(cx, cy, dx, dy):
+        return ((((dy - y1) * (cx - x1) > (cy - y1) * (dx - x1)) != ((dy - y2) * (cx - x2) > (cy - y2) * (dx - x2))) &
+                (((cy - y1) * (x2 - x1) > (y2 - y1) * (cx - x1)) != ((dy - y1) * (x2 - x1) > (y2 - y1) * (dx - x1))))
+
+    hit = ((rx_min <= x1) & (x1 <= rx_max) & (ry_min <= y1) & (y1 <= ry_max) |
+           (rx_min <= x2) & (x2 <= rx_max) & (ry_min <= y2) & (y2 <= ry_max) |
+           crosses(rx_min, ry_min, rx_max, ry_min) |
+           crosses(rx_max, ry_min, rx_max, ry_max) |
+           crosses(rx_max, ry_max, rx_min, ry_max) |
+           crosses(rx_min, ry_max, rx_min, ry_min))
+    return ~np.asarray(hit)
 
 
 def get_waypoints_around_obstacle(start: Tuple[float, float], goal: Tuple[float, float],
@@ -140,21 +164,25 @@ def get_waypoints_around_obstacle(start: Tuple[float, float], goal: Tuple[float,
     mid_y = (start[1] + goal[1]) / 2
     step_size = 0.5
     max_iter = 100
+    offsets = np.arange(1, max_iter) * step_size
     valid_paths = []
 
+    # all candidate offsets of a direction/sign are tested at once; the first clear one is kept
     for direction in ['horizontal', 'vertical']:
         for sign in [1, -1]:
-            for i in range(1, max_iter):
-                intermediate = (
-                    (mid_x + sign * i * step_size, mid_y) if direction == 'horizontal'
-                    else (mid_x, mid_y + sign * i * step_size)
-                )
-                if (not line_intersects_rectangle(start, intermediate, rect, margin) and
-                        not line_intersects_rectangle(intermediate, goal, rect, margin)):
-                    length = (np.linalg.norm(np.array(intermediate) - np.array(start)) +
-                              np.linalg.norm(np.array(goal) - np.array(intermediate)))
-                    valid_paths.append((length, intermediate))
-                    break
+            if direction == 'horizontal':
+                inter_x, inter_y = mid_x + sign * offsets, mid_y
+            else:
+                inter_x, inter_y = mid_x, mid_y + sign * offsets
+            clear = (_segments_clear_of_rectangle(start[0], start[1], inter_x, inter_y, rect, margin) &
+                     _segments_clear_of_rectangle(inter_x, inter_y, goal[0], goal[1], rect, margin))
+            i = int(clear.argmax())
+            if clear[i]:
+                offset = sign * (i + 1) * step_size
+                intermediate = (mid_x + offset, mid_y) if direction == 'horizontal' else (mid_x, mid_y + offset)
+                length = (math.hypot(intermediate[0] - start[0], intermediate[1] - start[1]) +
+                          math.hypot(goal[0] - intermediate[0], goal[1] - intermediate[1]))
+                valid_paths.append((length, intermediate))
 
     if valid_paths:
         return [start, min(valid_paths, key=lambda x: x[0])[1], goal]
@@ -171,8 +199,8 @@ def get_waypoints_around_obstacle(start: Tuple[float, float], goal: Tuple[float,
     for corner in corners:
         if (not line_intersects_rectangle(start, corner, rect, margin) and
                 not line_intersects_rectangle(corner, goal, rect, margin)):
-            dist = (np.linalg.norm(np.array(start) - np.array(corner)) +
-                    np.linalg.norm(np.array(corner) - np.array(goal)))
+            dist = (math.hypot(start[0] - corner[0], start[1] - corner[1]) +
+                    math.hypot(corner[0] - goal[0], corner[1] - goal[1]))
             if dist < best_dist:
                 best_dist = dist
                 best_path = [start, corner, goal]
@@ -197,7 +225,7 @@ def calculate_path_length_tuples(path: List[Tuple[float, float]]) -> float:
     if len(path) < 2:
         return 0.0
     return sum(
-        ((path[i + 1][0] - path[i][0]) ** 2 + (path[i + 1][1] - path[i][1]) ** 2) ** 0.5
+        math.hypot(path[i + 1][0] - path[i][0], path[i + 1][1] - path[i][1])
         for i in range(len(path) - 1)
     )
 
@@ -272,7 +300,7 @@ def visualize_single_path(start: Tuple[float, float], goal: Tuple[float, float],
             label='Direct path')
 
     path_length = calculate_path_length_tuples(path)
-    direct_length = float(np.linalg.norm(np.array(goal) - np.array(start)))
+    direct_length = math.hypot(goal[0] - start[0], goal[1] - start[1])
     ax.set_title(
         f'Path Planning with Obstacle Avoidance\n'
         f'Path length: {path_length:.2f}m | Direct: {direct_length:.2f}m | '
@@ -363,7 +391,7 @@ def generate_oracle_path_for_experiment(experiment_path: str, output_dir: str,
     goal = target_pos
     path = generate_path(start, goal, obstacles, margin=margin)
     path_length = calculate_path_length_tuples(path)
-    direct_length = float(np.linalg.norm(np.array(goal) - np.array(start)))
+    direct_length = math.hypot(goal[0] - start[0], goal[1] - start[1])
 
     oracle_data = {
         "experiment_id": experiment.get('id'),
@@ -763,7 +791,7 @@ Examples:
         print(f"Generating path from {start} to {goal}…")
         path = generate_path(start, goal, obstacles, margin=args.margin)
         path_length = calculate_path_length_tuples(path)
-        direct_length = float(np.linalg.norm(np.array(goal) - np.array(start)))
+        direct_length = math.hypot(goal[0] - start[0], goal[1] - start[1])
         print(f"\nPath: {len(path)} waypoints")
         for i, wp in enumerate(path):
             print(f"  {i}: ({wp[0]:.3f}, {wp[1]:.3f})")
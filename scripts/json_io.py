@@ -0,0 +1,19 @@
+"""
+JSON loading shared by the experiment scripts.
+"""
+
+import mmap
+import os
+import orjson
+
+# Files above this size are parsed straight from an mmap instead of being read into memory first
+MMAP_MIN_SIZE = 64 * 1024
+
+
+def load_json(path):
+    """Load JSON data from file; files above MMAP_MIN_SIZE are parsed straight from an mmap."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_MIN_SIZE:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
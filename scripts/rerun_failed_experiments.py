@@ -1,6 +1,7 @@
 from concurrent.futures import Future, ThreadPoolExecutor
 import threading
-from common.llm.chats import GeminiChat, OllamaChat, OpenAIChat
+from common.llm.chats import getChat
+import os
 from common.robot.LLMRobotController import LLMRobotController
 from common.utils.environment import getRobotPose, setRobotPose, setRandomRobotPose
 from common.utils.geometry import find_safe_position
@@ -99,10 +100,7 @@ if __name__ == "__main__":
     # khepheraDevices = KhepheraDevices(supervisor, eventManager, TIME_STEP)
     robot = PR2Controller(pr2Devices, eventManager)
     # robot = KhepheraController(khepheraDevices, eventManager)
-    geminiChat = GeminiChat()
-    ollamaChat = OllamaChat(model_name="gemma3:4b")
-    openaiChat = OpenAIChat(model_name="gpt-4o-mini")
-    robotChat = geminiChat
+    robotChat = getChat(os.getenv("ROBOT_CHAT", "gemini"))
     robotChat.set_system_instruction(readSystemInstruction())
     llmController = LLMRobotController(robot, robotChat, eventManager)
 
@@ -147,10 +145,13 @@ if __name__ == "__main__":
     eventManager.subscribe(EventType.SIMULATION_ABORTED, lambda _: (print("LLM aborted"), simulationLock.release()))
 
     step_counter = 0
+    # reused every step; SIMULATION_STEP handlers must not keep a reference to it
+    stepEvent = StepEventData(step_counter)
     initialPose = pose
     while supervisor.step(TIME_STEP) != -1:
         try:
-            eventManager.notify(EventType.SIMULATION_STEP, StepEventData(step_counter))
+            stepEvent.step = step_counter
+            eventManager.notify(EventType.SIMULATION_STEP, stepEvent)
             pressed_key = keyboard.getKey()
 
             try:
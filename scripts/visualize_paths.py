@@ -306,12 +306,49 @@ def visualize_frontier_path_from_file(path_file: str,
     plt.close(fig)
 
 
+def _draw_frontier_obstacles_and_targets(ax, obstacle_list: List[Rectangle]) -> None:
+    """Draw obstacle outlines and target markers for frontier path plots."""
+    for obstacle in obstacle_list:
+        ax.add_patch(patches.Rectangle(
+            (obstacle.x, obstacle.y), obstacle.width, obstacle.height,
+            linewidth=2, fill=False, color='saddlebrown',
+        ))
+    for x, y, label in TARGETS:
+        ax.scatter(x, y, s=250, marker='o', color='gray')
+        ax.text(x, y, label, fontsize=10, ha='center', va='center')
+
+
+class FrontierCanvas:
+    """
+    A figure with obstacles and targets already drawn, reused across
+    visualize_frontier_path calls so that only the paths are redrawn per image.
+    """
+
+    def __init__(self, obstacle_list: List[Rectangle]):
+        self.fig, self.ax = plt.subplots()
+        _draw_frontier_obstacles_and_targets(self.ax, obstacle_list)
+        self.ax.set_axis_off()
+        self.fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
+        self._static = set(self.ax.get_children())
+
+    def reset(self) -> None:
+        """Remove everything drawn since construction."""
+        for artist in [*self.ax.lines, *self.ax.collections, *self.ax.texts, *self.ax.patches]:
+            if artist not in self._static:
+                artist.remove()
+
+    def close(self) -> None:
+        plt.close(self.fig)
+
+
 def visualize_frontier_path(start: Tuple[float, float], goal: Tuple[float, float],
                              path: List[Tuple[float, float]],
                              obstacle_list: List[Rectangle],
                              save_path: str,
                              experiment_data: Dict = None,
-                             title: str = "Frontier Path") -> None:
+                             title: str = "Frontier Path",
+                             canvas: Optional[FrontierCanvas] = None,
+                             robot_path_xy: Optional[Tuple[List[float], List[float]]] = None) -> None:
     """
     Visualize an oracle/planned frontier path with optional actual robot path overlay.
 
@@ -325,20 +362,31 @@ def visualize_frontier_path(start: Tuple[float, float], goal: Tuple[float, float
         save_path:       Output image path.
         experiment_data: If provided, overlays the actual robot path in blue.
         title:           Plot title.
+        canvas:          Reuse this canvas (its own obstacles and targets) instead
+                         of creating and closing a new figure.
+        robot_path_xy:   Precomputed (xs, ys) of the actual robot path, so that
+                         experiment_data['iterations'] is not walked again.
     """
-    fig, ax = plt.subplots()
+    if canvas is None:
+        fig, ax = plt.subplots()
+    else:
+        fig, ax = canvas.fig, canvas.ax
+        canvas.reset()
 
     # -- Actual robot path --------------------------------------------------
     if experiment_data:
-        xs: List[float] = []
-        ys: List[float] = []
-        starting_pos = experiment_data['initialRobotPose']['position']
-        xs.append(starting_pos['x'])
-        ys.append(starting_pos['y'])
-        for iteration in experiment_data['iterations']:
-            pose = iteration['endRobotStatus']['position']
-            xs.append(pose['x'])
-            ys.append(pose['y'])
+        if robot_path_xy is not None:
+            xs, ys = robot_path_xy
+        else:
+            xs: List[float] = []
+            ys: List[float] = []
+            starting_pos = experiment_data['initialRobotPose']['position']
+            xs.append(starting_pos['x'])
+            ys.append(starting_pos['y'])
+            for iteration in experiment_data['iterations']:
+                pose = iteration['endRobotStatus']['position']
+                xs.append(pose['x'])
+                ys.append(pose['y'])
         ax.plot(xs, ys, linewidth=3, color='blue', alpha=0.5, label='Actual Path')
         _draw_aggregated_positions(ax, xs, ys)
 
@@ -349,14 +397,8 @@ def visualize_frontier_path(start: Tuple[float, float], goal: Tuple[float, float
                 label='Frontier Path', zorder=5)
 
     # -- Obstacles / targets ------------------------------------------------
-    for obstacle in obstacle_list:
-        ax.add_patch(patches.Rectangle(
-            (obstacle.x, obstacle.y), obstacle.width, obstacle.height,
-            linewidth=2, fill=False, color='saddlebrown',
-        ))
-    for x, y, label in TARGETS:
-        ax.scatter(x, y, s=250, marker='o', color='gray')
-        ax.text(x, y, label, fontsize=10, ha='center', va='center')
+    if canvas is None:
+        _draw_frontier_obstacles_and_targets(ax, obstacle_list)
 
     # -- Axis limits --------------------------------------------------------
     all_xs = [p[0] for p in path] + [t[0] for t in TARGETS]
@@ -370,9 +412,10 @@ def visualize_frontier_path(start: Tuple[float, float], goal: Tuple[float, float
 
     ax.legend(loc='best', fontsize=10)
     ax.set_axis_off()
-    plt.subplots_adjust(left=0, right=1, top=1, bottom=0)
+    fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
     fig.savefig(save_path, dpi=300, transparent=False, bbox_inches='tight', pad_inches=0)
-    plt.close(fig)
+    if canvas is None:
+        plt.close(fig)
 
 
 def process_all_frontier_paths(
@@ -1,9 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+import atexit
 from typing import List
 import json
+import orjson
 from dataclasses import dataclass, field
 import dataclasses
 import os
 import re
+import sys
 from datetime import datetime
 
 @dataclass
@@ -164,6 +168,9 @@ class LLMSession:
         Behavior:
         - In partial mode (final=False) overwrite a stable partial filename: experiment_<model>_partial.json
         - When final=True, write a timestamped file: experiment_<model>_<YYYYmmdd-HHMMSS>.json
+        - The session is snapshotted immediately; the file is written on a background thread, in call order.
+          Partial saves return as soon as the write is queued; final saves wait until the file
+          (and the pending partial writes before it) is on disk and return None if it failed.
         - Writes atomically by writing to a temporary file then replacing the target file.
         - Best-effort: exceptions are caught and logged to stderr but not raised.
         """
@@ -181,39 +188,47 @@ class LLMSession:
                     base = f"experiment_{safe_model}_partial"
 
             path = os.path.join(out_dir, f"{base}.json")
-            tmp_path = path + ".tmp"
+            latest_path = os.path.join(out_dir, f"experiment_{safe_model}_latest.json") if final else None
 
-            # build serializable object
+            # build serializable object now, the session keeps changing while the write is pending
             obj = self.asObject()
             serializable = self._serialize(obj)
 
-            # write atomically
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(serializable, f, indent=4, ensure_ascii=False)
-                f.flush()
-                os.fsync(f.fileno())
-
-            os.replace(tmp_path, path)
-
-            # If final, also update a copy named 'latest' for quick access
-            if final:
-                latest_path = os.path.join(out_dir, f"experiment_{safe_model}_latest.json")
-                try:
-                    with open(latest_path + ".tmp", "w", encoding="utf-8") as f:
-                        json.dump(serializable, f, indent=4, ensure_ascii=False)
-                        f.flush()
-                        os.fsync(f.fileno())
-                    os.replace(latest_path + ".tmp", latest_path)
-                except Exception:
-                    # non-fatal
-                    pass
-
+            pending = _saveExecutor.submit(_writeSession, serializable, path, latest_path)
+            if final and not pending.result():
+                return None
             return path
         except Exception as e:
             # best-effort: don't raise, just return None
-            try:
-                import sys
-                print(f"Failed to save LLMSession: {e}", file=sys.stderr)
-            except Exception:
-                pass
+            print(f"Failed to save LLMSession: {e}", file=sys.stderr)
             return None
+
+# single worker so that partial and final snapshots reach the disk in order
+_saveExecutor = ThreadPoolExecutor(max_workers=1)
+# flush queued snapshots when the controller exits
+atexit.register(_saveExecutor.shutdown, wait=True)
+
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _writeJSONAtomically(obj, path: str):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(obj, option=_ORJSON_OPTIONS))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _writeSession(serializable, path: str, latest_path: str = None) -> bool:
+    try:
+        _writeJSONAtomically(serializable, path)
+    except Exception as e:
+        print(f"Failed to save LLMSession: {e}", file=sys.stderr)
+        return False
+    # If final, also update a copy named 'latest' for quick access
+    if latest_path is not None:
+        try:
+            _writeJSONAtomically(serializable, latest_path)
+        except Exception:
+            # non-fatal
+            pass
+    return True
@@ -3,19 +3,22 @@ from typing import Callable
 
 class EventManager:
     def __init__(self):
+        # handlers per event type, kept in a dict used as an ordered set for O(1) removal
         self._observers = {}
 
     def subscribe(self, eventType: EventType, handler: Callable[[EventData], None]):
         if eventType not in self._observers:
-            self._observers[eventType] = []
-        self._observers[eventType].append(handler)
+            self._observers[eventType] = {}
+        self._observers[eventType][handler] = None
 
     def unsubscribe(self, handler: Callable[[EventData], None]):
-        for _, observers in self._observers.items():
-            if handler in observers:
-                observers.remove(handler)
+        for observers in self._observers.values():
+            observers.pop(handler, None)
 
     def notify(self, eventType: EventType, data: EventData):
-        for observer in self._observers.get(eventType, []):
+        observers = self._observers.get(eventType)
+        if not observers:
+            return
+        # snapshot, handlers may unsubscribe themselves while being notified
+        for observer in tuple(observers):
             observer(data)
-            
\ No newline at end of file
@@ -0,0 +1,44 @@
+import unittest
+
+from scripts.analyze_experiments import EXPERIMENT_FILENAME_RE, _split_experiment_info, extract_experiment_info
+
+FILENAMES = [
+    "1_pos_1_experiment_gemini-2_0-flash_20251118-095910.json",
+    "13_pos_4_experiment_gpt-4o_20251120-101500.json",
+    "5_pos_2_experiment_model_.json",
+    "5_pos_2_experiment__20251118-095910.json",
+    "5_pos_2_experiment_fooexperiment_20251118-095910.json",
+    "5_pos_2_experiment_a_experiment_b_20251118-095910.json",
+    "5_pos_2_experiment_model.json_20251118-095910.json",
+    "5_pos_2_experiment_model_20251118.095910.json",
+    "5_pos_2_experiment_model.json",
+    "5_pos_2_run_experiment_model_20251118-095910.json",
+    "x.json_pos_2_experiment_model_20251118-095910.json",
+    "5_pos_2_nothing_here.json",
+    "5_pos_2.json",
+]
+
+
+class ExtractExperimentInfoTest(unittest.TestCase):
+
+    def test_standard_name(self):
+        self.assertEqual(
+            extract_experiment_info("1_pos_1_experiment_gemini-2_0-flash_20251118-095910.json"),
+            ("1", "gemini-2_0-flash", "20251118-095910"),
+        )
+
+    def test_regex_agrees_with_split_parse(self):
+        for filename in FILENAMES:
+            with self.subTest(filename=filename):
+                self.assertEqual(extract_experiment_info(filename), _split_experiment_info(filename))
+
+    def test_regex_rejects_irregular_models(self):
+        for filename in ("5_pos_2_experiment_fooexperiment_20251118-095910.json",
+                         "5_pos_2_experiment_a_experiment_b_20251118-095910.json",
+                         "5_pos_2_experiment_model.json_20251118-095910.json"):
+            with self.subTest(filename=filename):
+                self.assertIsNone(EXPERIMENT_FILENAME_RE.match(filename))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import sys
+import types
+import unittest
+import numpy as np
+
+try:
+    import controller  # noqa: F401
+except ModuleNotFoundError:
+    # outside Webots: the adapters only need these names to exist at import time
+    for name, attrs in {
+        "controller": {},
+        "controller.lidar": {"Lidar": object},
+        "controller.motor": {"Motor": object},
+        "controller.position_sensor": {"PositionSensor": object},
+        "controller.constants": {"constant": lambda name: 0},
+    }.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attrs)
+        sys.modules[name] = module
+
+from controllers.webots.adapters.lidar import LidarSnapshot
+
+
+def rangeImageView(values):
+    """Read-only reversed view, as WBLidar.getImage builds it from the device buffer"""
+    return np.frombuffer(np.asarray(values, dtype=np.float32).tobytes(), dtype=np.float32)[::-1]
+
+
+class LidarSnapshotTest(unittest.TestCase):
+
+    def test_array_copy_is_writable_and_detached(self):
+        view = rangeImageView([1.0, 2.0, 3.0, 4.0])
+        snapshot = LidarSnapshot(view[1:3])
+        copied = np.array(snapshot)
+        self.assertTrue(copied.flags.writeable)
+        self.assertFalse(np.shares_memory(copied, view))
+        copied[0] = -1.0
+        self.assertEqual(snapshot[0], 3.0)
+
+    def test_asarray_keeps_the_view(self):
+        view = rangeImageView([1.0, 2.0, 3.0])
+        snapshot = LidarSnapshot(view)
+        self.assertTrue(np.shares_memory(np.asarray(snapshot), view))
+        self.assertEqual(np.min(snapshot), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()